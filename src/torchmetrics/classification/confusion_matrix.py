@@ -11,7 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Any, List, Optional, Type
+from typing import Any, ClassVar, Hashable, List, Optional, Tuple, Type
 
 import torch
 from torch import Tensor
@@ -112,6 +112,7 @@ class BinaryConfusionMatrix(Metric):
     is_differentiable: bool = False
     higher_is_better: Optional[bool] = None
     full_state_update: bool = False
+    _compute_group_attributes: ClassVar[Tuple[str, ...]] = ("threshold", "ignore_index", "validate_args")
 
     confmat: Tensor
 
@@ -253,6 +254,7 @@ class MulticlassConfusionMatrix(Metric):
     is_differentiable: bool = False
     higher_is_better: Optional[bool] = None
     full_state_update: bool = False
+    _compute_group_attributes: ClassVar[Tuple[str, ...]] = ("num_classes", "ignore_index", "validate_args")
 
     confmat: Tensor
 
@@ -282,6 +284,12 @@ class MulticlassConfusionMatrix(Metric):
         confmat = _multiclass_confusion_matrix_update(preds, target, self.num_classes)
         self.confmat += confmat
 
+    def _statistic_key(self) -> Optional[Hashable]:
+        """Key of the confusion matrix, which e.g. the states of ``MulticlassStatScores`` can be derived from."""
+        if type(self).update is not MulticlassConfusionMatrix.update:
+            return None
+        return ("multiclass_confmat", self.num_classes, self.ignore_index, self.validate_args)
+
     def compute(self) -> Tensor:
         """Compute confusion matrix."""
         return _multiclass_confusion_matrix_compute(self.confmat, self.normalize)
@@ -393,6 +401,7 @@ class MultilabelConfusionMatrix(Metric):
     is_differentiable: bool = False
     higher_is_better: Optional[bool] = None
     full_state_update: bool = False
+    _compute_group_attributes: ClassVar[Tuple[str, ...]] = ("num_labels", "threshold", "ignore_index", "validate_args")
 
     confmat: Tensor
 
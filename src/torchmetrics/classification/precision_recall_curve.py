@@ -11,7 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Any, List, Optional, Tuple, Type, Union
+from typing import Any, ClassVar, List, Optional, Tuple, Type, Union
 
 import torch
 from torch import Tensor
@@ -39,7 +39,7 @@ from torchmetrics.functional.classification.precision_recall_curve import (
 )
 from torchmetrics.metric import Metric
 from torchmetrics.utilities.compute import _auc_compute_without_check
-from torchmetrics.utilities.data import dim_zero_cat
+from torchmetrics.utilities.data import CatBuffer, dim_zero_cat
 from torchmetrics.utilities.enums import ClassificationTask
 from torchmetrics.utilities.imports import _MATPLOTLIB_AVAILABLE
 from torchmetrics.utilities.plot import _AX_TYPE, _PLOT_OUT_TYPE, plot_curve
@@ -129,9 +129,10 @@ class BinaryPrecisionRecallCurve(Metric):
     is_differentiable: bool = False
     higher_is_better: Optional[bool] = None
     full_state_update: bool = False
+    _compute_group_attributes: ClassVar[Tuple[str, ...]] = ("thresholds", "ignore_index", "validate_args")
 
-    preds: List[Tensor]
-    target: List[Tensor]
+    preds: CatBuffer
+    target: CatBuffer
     confmat: Tensor
 
     def __init__(
@@ -151,8 +152,8 @@ class BinaryPrecisionRecallCurve(Metric):
         thresholds = _adjust_threshold_arg(thresholds)
         if thresholds is None:
             self.thresholds = thresholds
-            self.add_state("preds", default=[], dist_reduce_fx="cat")
-            self.add_state("target", default=[], dist_reduce_fx="cat")
+            self.add_state("preds", default=CatBuffer(), dist_reduce_fx="cat")
+            self.add_state("target", default=CatBuffer(), dist_reduce_fx="cat")
         else:
             self.register_buffer("thresholds", thresholds, persistent=False)
             self.add_state(
@@ -321,9 +322,16 @@ class MulticlassPrecisionRecallCurve(Metric):
     is_differentiable: bool = False
     higher_is_better: Optional[bool] = None
     full_state_update: bool = False
-
-    preds: List[Tensor]
-    target: List[Tensor]
+    _compute_group_attributes: ClassVar[Tuple[str, ...]] = (
+        "num_classes",
+        "thresholds",
+        "average",
+        "ignore_index",
+        "validate_args",
+    )
+
+    preds: CatBuffer
+    target: CatBuffer
     confmat: Tensor
 
     def __init__(
@@ -347,8 +355,8 @@ class MulticlassPrecisionRecallCurve(Metric):
         thresholds = _adjust_threshold_arg(thresholds)
         if thresholds is None:
             self.thresholds = thresholds
-            self.add_state("preds", default=[], dist_reduce_fx="cat")
-            self.add_state("target", default=[], dist_reduce_fx="cat")
+            self.add_state("preds", default=CatBuffer(), dist_reduce_fx="cat")
+            self.add_state("target", default=CatBuffer(), dist_reduce_fx="cat")
         else:
             self.register_buffer("thresholds", thresholds, persistent=False)
             self.add_state(
@@ -518,9 +526,10 @@ class MultilabelPrecisionRecallCurve(Metric):
     is_differentiable: bool = False
     higher_is_better: Optional[bool] = None
     full_state_update: bool = False
+    _compute_group_attributes: ClassVar[Tuple[str, ...]] = ("num_labels", "thresholds", "ignore_index", "validate_args")
 
-    preds: List[Tensor]
-    target: List[Tensor]
+    preds: CatBuffer
+    target: CatBuffer
     confmat: Tensor
 
     def __init__(
@@ -542,8 +551,8 @@ class MultilabelPrecisionRecallCurve(Metric):
         thresholds = _adjust_threshold_arg(thresholds)
         if thresholds is None:
             self.thresholds = thresholds
-            self.add_state("preds", default=[], dist_reduce_fx="cat")
-            self.add_state("target", default=[], dist_reduce_fx="cat")
+            self.add_state("preds", default=CatBuffer(), dist_reduce_fx="cat")
+            self.add_state("target", default=CatBuffer(), dist_reduce_fx="cat")
         else:
             self.register_buffer("thresholds", thresholds, persistent=False)
             self.add_state(
@@ -11,7 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Any, Callable, List, Optional, Tuple, Type, Union
+from typing import Any, Callable, ClassVar, Hashable, List, Optional, Tuple, Type, Union
 
 import torch
 from torch import Tensor
@@ -27,6 +27,7 @@ from torchmetrics.functional.classification.stat_scores import (
     _multiclass_stat_scores_arg_validation,
     _multiclass_stat_scores_compute,
     _multiclass_stat_scores_format,
+    _multiclass_stat_scores_from_confmat,
     _multiclass_stat_scores_tensor_validation,
     _multiclass_stat_scores_update,
     _multilabel_stat_scores_arg_validation,
@@ -160,6 +161,12 @@ class BinaryStatScores(_AbstractStatScores):
     is_differentiable: bool = False
     higher_is_better: Optional[bool] = None
     full_state_update: bool = False
+    _compute_group_attributes: ClassVar[Tuple[str, ...]] = (
+        "threshold",
+        "multidim_average",
+        "ignore_index",
+        "validate_args",
+    )
 
     def __init__(
         self,
@@ -302,6 +309,14 @@ class MulticlassStatScores(_AbstractStatScores):
     is_differentiable: bool = False
     higher_is_better: Optional[bool] = None
     full_state_update: bool = False
+    _compute_group_attributes: ClassVar[Tuple[str, ...]] = (
+        "num_classes",
+        "top_k",
+        "average",
+        "multidim_average",
+        "ignore_index",
+        "validate_args",
+    )
 
     def __init__(
         self,
@@ -339,6 +354,20 @@ class MulticlassStatScores(_AbstractStatScores):
         )
         self._update_state(tp, fp, tn, fn)
 
+    def _derived_statistic_key(self) -> Optional[Hashable]:
+        """Get the key of the confusion matrix the states can be derived from, if the metric is computed globally."""
+        if type(self).update is not MulticlassStatScores.update or self.multidim_average != "global" or self.top_k != 1:
+            return None
+        return ("multiclass_confmat", self.num_classes, self.ignore_index, self.validate_args)
+
+    def _derive_states(self, source: Metric) -> None:
+        """Set the states from the confusion matrix of a ``MulticlassConfusionMatrix`` metric."""
+        tp, fp, tn, fn = _multiclass_stat_scores_from_confmat(source.confmat, self.average)
+        self.tp = tp.reshape(self.tp.shape)
+        self.fp = fp.reshape(self.fp.shape)
+        self.tn = tn.reshape(self.tn.shape)
+        self.fn = fn.reshape(self.fn.shape)
+
     def compute(self) -> Tensor:
         """Compute the final statistics."""
         tp, fp, tn, fn = self._final_state()
@@ -450,6 +479,13 @@ class MultilabelStatScores(_AbstractStatScores):
     is_differentiable: bool = False
     higher_is_better: Optional[bool] = None
     full_state_update: bool = False
+    _compute_group_attributes: ClassVar[Tuple[str, ...]] = (
+        "num_labels",
+        "threshold",
+        "multidim_average",
+        "ignore_index",
+        "validate_args",
+    )
 
     def __init__(
         self,
@@ -13,17 +13,18 @@
 # limitations under the License.
 # this is just a bypass for this module name collision with built-in one
 from collections import OrderedDict
+from contextlib import contextmanager
 from copy import deepcopy
-from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, Generator, Hashable, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 import torch
 from torch import Tensor
 from torch.nn import ModuleDict
 from typing_extensions import Literal
 
-from torchmetrics.metric import Metric
+from torchmetrics.metric import Metric, MetricSyncHandle, _sync_metrics_async
 from torchmetrics.utilities import rank_zero_warn
-from torchmetrics.utilities.data import _flatten_dict, allclose
+from torchmetrics.utilities.data import CatBuffer, _flatten_dict, allclose
 from torchmetrics.utilities.imports import _MATPLOTLIB_AVAILABLE
 from torchmetrics.utilities.plot import _AX_TYPE, _PLOT_OUT_TYPE, plot_single_or_multi_val
 
@@ -67,6 +68,11 @@ class MetricCollection(ModuleDict):
         reference and a copy of states are instead returned in this case (reference will be reestablished on the next
         call to ``update``).
 
+    .. note::
+        If the metrics in the collection are initialized with ``coalesce_sync=True``, the states of all metrics (or
+        only one metric per compute group) will be synchronized together when ``compute`` is called on the collection,
+        using a minimal number of collective operations for the whole collection.
+
     .. note::
         Metric collections can be nested at initialization (see last example) but the output of the collection will
         still be a single flatten dictionary combining the prefix and postfix arguments from the nested collection.
@@ -184,6 +190,9 @@ class MetricCollection(ModuleDict):
         self._enable_compute_groups = compute_groups
         self._groups_checked: bool = False
         self._state_is_copy: bool = False
+        self._static_group_leaders: Set[str] = set()
+        self._fused_groups: Dict[int, int] = {}
+        self._fused_states_outdated: bool = False
 
         self.add_metrics(metrics, *additional_metrics)
 
@@ -206,10 +215,14 @@ class MetricCollection(ModuleDict):
         """
         # Use compute groups if already initialized and checked
         if self._groups_checked:
-            for cg in self._groups.values():
+            for idx, cg in self._groups.items():
+                # groups with states derived from the states of another group are not updated at all
+                if idx in self._fused_groups:
+                    continue
                 # only update the first member
                 m0 = getattr(self, cg[0])
                 m0.update(*args, **m0._filter_kwargs(**kwargs))
+            self._fused_states_outdated = bool(self._fused_groups)
             if self._state_is_copy:
                 # If we have deep copied state in between updates, reestablish link
                 self._compute_groups_create_state_ref()
@@ -224,42 +237,29 @@ class MetricCollection(ModuleDict):
                 # create reference between states
                 self._compute_groups_create_state_ref()
                 self._groups_checked = True
+                self._init_fused_groups()
 
     def _merge_compute_groups(self) -> None:
         """Iterate over the collection of metrics, checking if the state of each metric matches another.
 
-        If so, their compute groups will be merged into one. The complexity of the method is approximately
-        ``O(number_of_metrics_in_collection ** 2)``, as all metrics need to be compared to all other metrics.
+        If so, their compute groups will be merged into one. Groups that were formed from a static compute group key at
+        initialization are known to differ from each other and are never compared, such that only groups of metrics
+        that do not declare a key (see ``Metric._compute_group_attributes``) need to be compared to the other groups.
 
         """
-        num_groups = len(self._groups)
-        while True:
-            for cg_idx1, cg_members1 in deepcopy(self._groups).items():
-                for cg_idx2, cg_members2 in deepcopy(self._groups).items():
-                    if cg_idx1 == cg_idx2:
-                        continue
-
-                    metric1 = getattr(self, cg_members1[0])
-                    metric2 = getattr(self, cg_members2[0])
-
-                    if self._equal_metric_states(metric1, metric2):
-                        self._groups[cg_idx1].extend(self._groups.pop(cg_idx2))
-                        break
-
-                # Start over if we merged groups
-                if len(self._groups) != num_groups:
+        merged: List[List[str]] = []
+        for members in self._groups.values():
+            metric = getattr(self, members[0])
+            is_static = members[0] in self._static_group_leaders
+            for group in merged:
+                if is_static and group[0] in self._static_group_leaders:
+                    continue
+                if self._equal_metric_states(getattr(self, group[0]), metric):
+                    group.extend(members)
                     break
-
-            # Stop when we iterate over everything and do not merge any groups
-            if len(self._groups) == num_groups:
-                break
-            num_groups = len(self._groups)
-
-        # Re-index groups
-        temp = deepcopy(self._groups)
-        self._groups = {}
-        for idx, values in enumerate(temp.values()):
-            self._groups[idx] = values
+            else:
+                merged.append(list(members))
+        self._groups = dict(enumerate(merged))
 
     @staticmethod
     def _equal_metric_states(metric1: Metric, metric2: Metric) -> bool:
@@ -284,8 +284,44 @@ class MetricCollection(ModuleDict):
             if isinstance(state1, list) and isinstance(state2, list):
                 return all(s1.shape == s2.shape and allclose(s1, s2) for s1, s2 in zip(state1, state2))
 
+            if isinstance(state1, CatBuffer) and isinstance(state2, CatBuffer):
+                return len(state1) == len(state2) and (not state1 or allclose(state1.data, state2.data))
+
         return True
 
+    def _init_fused_groups(self) -> None:
+        """Find compute groups whose states can be derived from the states of another compute group.
+
+        A group is fused into another group if its first metric can derive its states from a sufficient statistic held
+        by the first metric of the other group, e.g. the statistics of ``MulticlassStatScores`` based metrics from the
+        confusion matrix of ``MulticlassConfusionMatrix``. Fused groups are not updated, instead their states are
+        derived when they are needed.
+
+        """
+        sources: Dict[Hashable, int] = {}
+        for idx, cg in self._groups.items():
+            key = getattr(self, cg[0])._statistic_key()
+            if key is not None:
+                sources.setdefault(key, idx)
+        self._fused_groups = {}
+        for idx, cg in self._groups.items():
+            key = getattr(self, cg[0])._derived_statistic_key()
+            if key is not None and key in sources:
+                self._fused_groups[idx] = sources[key]
+        self._fused_states_outdated = False
+
+    def _derive_fused_states(self) -> None:
+        """Derive the states of fused compute groups from the states of the group holding the sufficient statistic."""
+        if not self._fused_states_outdated:
+            return
+        for idx, source_idx in self._fused_groups.items():
+            m0 = getattr(self, self._groups[idx][0])
+            source = getattr(self, self._groups[source_idx][0])
+            m0._derive_states(source)
+            m0._update_count = source._update_count
+            m0._computed = None
+        self._fused_states_outdated = False
+
     def _compute_groups_create_state_ref(self, copy: bool = False) -> None:
         """Create reference between metrics in the same compute group.
 
@@ -294,6 +330,7 @@ class MetricCollection(ModuleDict):
                 of just passed by reference
 
         """
+        self._derive_fused_states()
         if not self._state_is_copy:
             for cg in self._groups.values():
                 m0 = getattr(self, cg[0])
@@ -307,6 +344,28 @@ class MetricCollection(ModuleDict):
                     mi._computed = deepcopy(m0._computed) if copy else m0._computed
         self._state_is_copy = copy
 
+    def _compute_groups_unshare_state(self) -> None:
+        """Give the members of compute groups their own states before each of them calls ``forward``.
+
+        Metrics that use the full state update in ``forward`` modify their states in place, which would accumulate the
+        same batch multiple times into states shared by reference. Tensor and buffer states are cloned and list states
+        are shallow copied, which is only needed for groups with at least one such metric.
+
+        """
+        for cg in self._groups.values():
+            metrics = [getattr(self, name) for name in cg]
+            if not any(m.full_state_update or m.full_state_update is None or m.dist_sync_on_step for m in metrics):
+                continue
+            for mi in metrics[1:]:
+                for state in mi._defaults:
+                    value = getattr(mi, state)
+                    setattr(mi, state, value.clone() if isinstance(value, (Tensor, CatBuffer)) else list(value))
+
+    def state_dict(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """Get the state dict of all metrics in the collection, with the states of fused compute groups derived."""
+        self._derive_fused_states()
+        return super().state_dict(*args, **kwargs)
+
     def compute(self) -> Dict[str, Any]:
         """Compute the result for each metric in the collection."""
         return self._compute_and_reduce("compute")
@@ -328,14 +387,22 @@ class MetricCollection(ModuleDict):
 
         """
         result = {}
-        for k, m in self.items(keep_base=True, copy_state=False):
-            if method_name == "compute":
-                res = m.compute()
-            elif method_name == "forward":
-                res = m(*args, **m._filter_kwargs(**kwargs))
-            else:
-                raise ValueError("method_name should be either 'compute' or 'forward', but got {method_name}")
-            result[k] = res
+        with self._coalesced_sync_context(should_sync=method_name == "compute"):
+            items = self.items(keep_base=True, copy_state=False)
+            if method_name == "forward" and self._groups_checked:
+                self._compute_groups_unshare_state()
+            for k, m in items:
+                if method_name == "compute":
+                    res = m.compute()
+                elif method_name == "forward":
+                    res = m(*args, **m._filter_kwargs(**kwargs))
+                else:
+                    raise ValueError("method_name should be either 'compute' or 'forward', but got {method_name}")
+                result[k] = res
+
+        if method_name == "forward" and self._groups_checked:
+            # every member did the same update, so the states can be shared again
+            self._compute_groups_create_state_ref()
 
         _, duplicates = _flatten_dict(result)
 
@@ -358,10 +425,105 @@ class MetricCollection(ModuleDict):
                 flattened_results[k] = res
         return {self._set_name(k): v for k, v in flattened_results.items()}
 
+    def _metrics_to_sync_together(self, coalesce_only: bool = False) -> Dict[int, List[Metric]]:
+        """Get the metrics whose states can be synced together with a coalesced sync, grouped by process group.
+
+        Only the first metric of each compute group is included, as the remaining members of the group share its states
+        by reference. Metrics using a custom ``dist_sync_fn`` or ``hierarchical_sync`` and metrics not running
+        distributed are never included.
+
+        Args:
+            coalesce_only: only include metrics that were initialized with ``coalesce_sync=True`` and that would
+                otherwise be synced by their own ``compute`` call
+
+        """
+        members = {name for cg in self._groups.values() for name in cg[1:]}
+        to_sync: Dict[int, List[Metric]] = {}
+        for name, m in self._modules.items():
+            if name in members or m._is_synced or m._sync_handle is not None:
+                continue
+            if coalesce_only and not (
+                m.coalesce_sync and m.compute_on_rank is None and m._to_sync and m._computed is None
+            ):
+                continue
+            if m.dist_sync_fn is None and not m.hierarchical_sync and m.distributed_available_fn():
+                to_sync.setdefault(id(m.process_group), []).append(m)
+        return to_sync
+
+    def sync_async(self) -> MetricSyncHandle:
+        """Start synchronizing the states of all metrics in the collection across processes without blocking.
+
+        The states of all metrics (only one metric per compute group) sharing the same process group are synchronized
+        together with coalesced, asynchronous collective operations. See :meth:`Metric.sync_async` for details. Calling
+        ``compute`` on the collection will wait for the synchronization to finish.
+
+        Returns:
+            A handle to the pending synchronization of all metrics in the collection
+
+        """
+        handles = [
+            _sync_metrics_async(metrics, group=metrics[0].process_group)
+            for metrics in self._metrics_to_sync_together().values()
+        ]
+        members = {name for cg in self._groups.values() for name in cg[1:]}
+        for name, m in self._modules.items():
+            # metrics with custom or hierarchical sync are synced on their own
+            if name not in members and m._sync_handle is None and (m.dist_sync_fn is not None or m.hierarchical_sync):
+                handles.append(m.sync_async())
+
+        def finalize() -> None:
+            for handle in handles:
+                handle.wait()
+
+        return MetricSyncHandle([work for handle in handles for work in handle._works], finalize)
+
+    @contextmanager
+    def _coalesced_sync_context(self, should_sync: bool = True) -> Generator:
+        """Synchronize the states of all metrics that allow it together, before computing the metrics one by one.
+
+        Asynchronous synchronizations started with ``sync_async`` are waited on, and the states of metrics
+        initialized with ``coalesce_sync=True`` are synced together with a single coalesced sync.
+
+        """
+        if not should_sync:
+            yield
+            return
+
+        synced = [m for m in self._modules.values() if m._sync_handle is not None]
+        for m in synced:
+            m._sync_handle.wait()
+            m._sync_handle = None
+        for metrics in self._metrics_to_sync_together(coalesce_only=True).values():
+            _sync_metrics_async(metrics, group=metrics[0].process_group).wait()
+            synced.extend(metrics)
+
+        if not synced:
+            yield
+            return
+
+        # members of compute groups are not synced themselves, so make sure they reference the synced states
+        if self._groups_checked:
+            self._state_is_copy = False
+            self._compute_groups_create_state_ref()
+
+        # states are already synced, so no metric should sync again during its own ``compute``
+        _to_sync = {name: m._to_sync for name, m in self._modules.items()}
+        for m in self._modules.values():
+            m._to_sync = False
+        try:
+            yield
+        finally:
+            for name, m in self._modules.items():
+                m._to_sync = _to_sync[name]
+            for m in synced:
+                if m._is_synced:
+                    m.unsync()
+
     def reset(self) -> None:
         """Call reset for each metric sequentially."""
         for m in self.values(copy_state=False):
             m.reset()
+        self._fused_states_outdated = False
         if self._enable_compute_groups and self._groups_checked:
             # reset state reference
             self._compute_groups_create_state_ref()
@@ -454,6 +616,7 @@ class MetricCollection(ModuleDict):
             )
 
         self._groups_checked = False
+        self._fused_groups = {}
         if self._enable_compute_groups:
             self._init_compute_groups()
         else:
@@ -463,7 +626,8 @@ class MetricCollection(ModuleDict):
         """Initialize compute groups.
 
         If user provided a list, we check that all metrics in the list are also in the collection. If set to `True` we
-        simply initialize each metric in the collection as its own group
+        group metrics with an equal static compute group key, which only needs to be computed once per metric. If all
+        metrics provide such a key, the groups are final and no states need to be compared after the first update
 
         """
         if isinstance(self._enable_compute_groups, list):
@@ -476,9 +640,26 @@ class MetricCollection(ModuleDict):
                             f" Please make sure that {self._enable_compute_groups} matches {self.keys(keep_base=True)}"
                         )
             self._groups_checked = True
+            self._init_fused_groups()
         else:
-            # Initialize all metrics as their own compute group
-            self._groups = {i: [str(k)] for i, k in enumerate(self.keys(keep_base=True))}
+            # Group metrics with the same static key together. Metrics without a key form their own group until their
+            # states can be compared after the first update
+            groups: Dict[Hashable, List[str]] = {}
+            self._static_group_leaders = set()
+            for name, metric in self._modules.items():
+                key = metric._compute_group_key()
+                if key is None:
+                    groups[("_no_key", name)] = [name]
+                elif key in groups:
+                    groups[key].append(name)
+                else:
+                    groups[key] = [name]
+                    self._static_group_leaders.add(name)
+            self._groups = dict(enumerate(groups.values()))
+            self._groups_checked = all(cg[0] in self._static_group_leaders for cg in self._groups.values())
+            if self._groups_checked:
+                self._compute_groups_create_state_ref()
+                self._init_fused_groups()
 
     @property
     def compute_groups(self) -> Dict[int, List[str]]:
@@ -411,11 +411,26 @@ def _multiclass_stat_scores_update(
             target = target[idx]
         unique_mapping = target.to(torch.long) * num_classes + preds.to(torch.long)
         bins = _bincount(unique_mapping, minlength=num_classes**2)
-        confmat = bins.reshape(num_classes, num_classes)
-        tp = confmat.diag()
-        fp = confmat.sum(0) - tp
-        fn = confmat.sum(1) - tp
-        tn = confmat.sum() - (fp + fn + tp)
+        tp, fp, tn, fn = _multiclass_stat_scores_from_confmat(bins.reshape(num_classes, num_classes))
+    return tp, fp, tn, fn
+
+
+def _multiclass_stat_scores_from_confmat(
+    confmat: Tensor, average: Optional[Literal["micro", "macro", "weighted", "none"]] = "macro"
+) -> Tuple[Tensor, Tensor, Tensor, Tensor]:
+    """Derive the statistics from a confusion matrix of shape ``(num_classes, num_classes)``.
+
+    Gives the same statistics as ``_multiclass_stat_scores_update`` with ``top_k=1`` and ``multidim_average="global"``
+    for the inputs the confusion matrix was calculated from.
+
+    """
+    tp = confmat.diag()
+    fp = confmat.sum(0) - tp
+    fn = confmat.sum(1) - tp
+    tn = confmat.sum() - (fp + fn + tp)
+    if average == "micro":
+        tp, fp, fn = tp.sum(), fp.sum(), fn.sum()
+        tn = confmat.shape[0] * confmat.sum() - (fp + fn + tp)
     return tp, fp, tn, fn
 
 
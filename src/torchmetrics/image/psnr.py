@@ -112,8 +112,8 @@ class PeakSignalNoiseRatio(Metric):
                 raise ValueError("The `data_range` must be given when `dim` is not None.")
 
             self.data_range = None
-            self.add_state("min_target", default=tensor(0.0), dist_reduce_fx=torch.min)
-            self.add_state("max_target", default=tensor(0.0), dist_reduce_fx=torch.max)
+            self.add_state("min_target", default=tensor(0.0), dist_reduce_fx=torch.min, static_shape=True)
+            self.add_state("max_target", default=tensor(0.0), dist_reduce_fx=torch.max, static_shape=True)
         elif isinstance(data_range, tuple):
             self.add_state("data_range", default=tensor(data_range[1] - data_range[0]), dist_reduce_fx="mean")
             self.clamping_fn = partial(torch.clamp, min=data_range[0], max=data_range[1])
@@ -20,7 +20,20 @@ import inspect
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from copy import deepcopy
-from typing import Any, Callable, ClassVar, Dict, Generator, List, Optional, Sequence, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Collection,
+    Dict,
+    Generator,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import torch
 from lightning_utilities import apply_to_collection
@@ -28,6 +41,7 @@ from torch import Tensor
 from torch.nn import Module
 
 from torchmetrics.utilities.data import (
+    CatBuffer,
     _flatten,
     _squeeze_if_scalar,
     dim_zero_cat,
@@ -36,7 +50,16 @@ from torchmetrics.utilities.data import (
     dim_zero_min,
     dim_zero_sum,
 )
-from torchmetrics.utilities.distributed import gather_all_tensors
+from torchmetrics.utilities.distributed import (
+    _gather_all_tensors_coalesced_async,
+    _reduce_all_tensors_coalesced_async,
+    gather_all_tensors,
+    gather_all_tensors_hierarchical,
+    gather_tensors_to_rank,
+    reduce_all_tensors,
+    reduce_all_tensors_hierarchical,
+    reduce_tensors_to_rank,
+)
 from torchmetrics.utilities.exceptions import TorchMetricsUserError
 from torchmetrics.utilities.plot import _AX_TYPE, _PLOT_OUT_TYPE, plot_single_or_multi_val
 from torchmetrics.utilities.prints import rank_zero_warn
@@ -47,6 +70,37 @@ def jit_distributed_available() -> bool:
     return torch.distributed.is_available() and torch.distributed.is_initialized()
 
 
+class MetricSyncHandle:
+    """Handle to an asynchronous synchronization of metric states, as returned by :meth:`Metric.sync_async`.
+
+    The synchronized states are only set on the metric(s) once :meth:`wait` has been called, which is automatically done
+    when ``compute`` is called on a metric with a pending synchronization.
+
+    Args:
+        works: the pending collective work handles
+        finalize: function that is called once all work handles have completed
+
+    """
+
+    def __init__(self, works: Sequence[Any], finalize: Callable[[], None]) -> None:
+        self._works = list(works)
+        self._finalize = finalize
+        self._done = False
+
+    def is_completed(self) -> bool:
+        """Check if all collective operations have completed, without blocking."""
+        return self._done or all(work.is_completed() for work in self._works)
+
+    def wait(self) -> None:
+        """Block until all collective operations have completed and set the synchronized states on the metric(s)."""
+        if self._done:
+            return
+        for work in self._works:
+            work.wait()
+        self._done = True
+        self._finalize()
+
+
 class Metric(Module, ABC):
     """Base class for all metrics present in the Metrics API.
 
@@ -68,6 +122,8 @@ class Metric(Module, ABC):
         kwargs: additional keyword arguments, see :ref:`Metric kwargs` for more info.
 
             - compute_on_cpu: If metric state should be stored on CPU during computations. Only works for list states.
+              If set to ``"async"``, states on a CUDA device are copied into pinned host memory with non-blocking
+              copies on a side stream, which are only waited on when the states are needed e.g. in ``compute``.
             - dist_sync_on_step: If metric state should synchronize on ``forward()``. Default is ``False``
             - process_group: The process group on which the synchronization is called. Default is the world.
             - dist_sync_fn: Function that performs the allgather option on the metric state. Default is an custom
@@ -76,6 +132,19 @@ class Metric(Module, ABC):
               check of ``torch.distributed.is_available()`` and ``torch.distributed.is_initialized()``.
             - sync_on_compute: If metric state should synchronize when ``compute`` is called. Default is ``True``
             - compute_with_cache: If results from ``compute`` should be cached. Default is ``False``
+            - coalesce_sync: If all metric states should be synchronized together using a minimal number of collective
+              operations instead of one (or more) per state. Only applies when ``dist_sync_fn`` is not set.
+              Default is ``False``
+            - hierarchical_sync: If metric states should first be synchronized between the processes on the same node
+              and only afterwards between nodes, with only one process per node communicating across nodes. Either
+              ``True``, in which case the number of processes per node is read from the ``LOCAL_WORLD_SIZE``
+              environment variable, or the number of processes per node as an ``int``. Only applies when syncing over
+              the whole world and ``dist_sync_fn`` is not set. Default is ``False``
+            - compute_on_rank: Global rank of the only process that should run ``compute``. If set, the metric states
+              are only gathered onto this process when ``compute`` is called, instead of onto every process. Only
+              applies when ``dist_sync_fn`` is not set. Default is ``None``, meaning every process computes the metric
+            - broadcast_compute_result: If the value computed on ``compute_on_rank`` should be broadcasted to all other
+              processes. If ``False``, ``compute`` returns ``None`` on all other processes. Default is ``True``
 
     """
 
@@ -97,6 +166,11 @@ class Metric(Module, ABC):
     plot_upper_bound: Optional[float] = None
     plot_legend_name: Optional[str] = None
 
+    # names of the attributes that, together with the ``update`` method of the class and the declared states, fully
+    # determine the states after any sequence of updates. Declaring them allows ``MetricCollection`` to determine
+    # compute groups at construction instead of comparing states after the first update
+    _compute_group_attributes: ClassVar[Optional[Tuple[str, ...]]] = None
+
     def __init__(
         self,
         **kwargs: Any,
@@ -111,10 +185,13 @@ class Metric(Module, ABC):
         self._dtype = torch.get_default_dtype()
 
         self.compute_on_cpu = kwargs.pop("compute_on_cpu", False)
-        if not isinstance(self.compute_on_cpu, bool):
+        if not isinstance(self.compute_on_cpu, bool) and self.compute_on_cpu != "async":
             raise ValueError(
-                f"Expected keyword argument `compute_on_cpu` to be an `bool` but got {self.compute_on_cpu}"
+                "Expected keyword argument `compute_on_cpu` to be an `bool` or the string `'async'` but got"
+                f" {self.compute_on_cpu}"
             )
+        self._offload_stream: Optional["torch.cuda.Stream"] = None
+        self._offload_event: Optional["torch.cuda.Event"] = None
 
         self.dist_sync_on_step = kwargs.pop("dist_sync_on_step", False)
         if not isinstance(self.dist_sync_on_step, bool):
@@ -143,6 +220,33 @@ class Metric(Module, ABC):
                 f"Expected keyword argument `compute_with_cache` to be a `bool` but got {self.compute_with_cache}"
             )
 
+        self.coalesce_sync = kwargs.pop("coalesce_sync", False)
+        if not isinstance(self.coalesce_sync, bool):
+            raise ValueError(f"Expected keyword argument `coalesce_sync` to be a `bool` but got {self.coalesce_sync}")
+
+        self.hierarchical_sync = kwargs.pop("hierarchical_sync", False)
+        if not isinstance(self.hierarchical_sync, int) or self.hierarchical_sync < 0:
+            raise ValueError(
+                "Expected keyword argument `hierarchical_sync` to be a `bool` or a positive `int` but got"
+                f" {self.hierarchical_sync}"
+            )
+
+        self.compute_on_rank = kwargs.pop("compute_on_rank", None)
+        if self.compute_on_rank is not None and (
+            not isinstance(self.compute_on_rank, int)
+            or isinstance(self.compute_on_rank, bool)
+            or self.compute_on_rank < 0
+        ):
+            raise ValueError(
+                f"Expected keyword argument `compute_on_rank` to be a non-negative `int` but got {self.compute_on_rank}"
+            )
+        self.broadcast_compute_result = kwargs.pop("broadcast_compute_result", True)
+        if not isinstance(self.broadcast_compute_result, bool):
+            raise ValueError(
+                "Expected keyword argument `broadcast_compute_result` to be a `bool` but got"
+                f" {self.broadcast_compute_result}"
+            )
+
         if kwargs:
             kwargs_ = [f"`{a}`" for a in sorted(kwargs)]
             raise ValueError(f"Unexpected keyword arguments: {', '.join(kwargs_)}")
@@ -163,10 +267,12 @@ class Metric(Module, ABC):
         self._defaults: Dict[str, Union[List, Tensor]] = {}
         self._persistent: Dict[str, bool] = {}
         self._reductions: Dict[str, Union[str, Callable[..., Any], None]] = {}
+        self._static_shapes: Dict[str, bool] = {}
 
         # state management
         self._is_synced = False
         self._cache: Optional[Dict[str, Union[List[Tensor], Tensor]]] = None
+        self._sync_handle: Optional[MetricSyncHandle] = None
 
     @property
     def _update_called(self) -> bool:
@@ -190,14 +296,16 @@ class Metric(Module, ABC):
     @property
     def metric_state(self) -> Dict[str, Union[List[Tensor], Tensor]]:
         """Get the current state of the metric."""
+        self._wait_for_cpu_offload()
         return {attr: getattr(self, attr) for attr in self._defaults}
 
     def add_state(
         self,
         name: str,
-        default: Union[list, Tensor],
+        default: Union[list, Tensor, CatBuffer],
         dist_reduce_fx: Optional[Union[str, Callable]] = None,
         persistent: bool = False,
+        static_shape: bool = False,
     ) -> None:
         """Add metric state variable. Only used by subclasses.
 
@@ -210,8 +318,9 @@ class Metric(Module, ABC):
 
         Args:
             name: The name of the state variable. The variable will then be accessible at ``self.name``.
-            default: Default value of the state; can either be a :class:`~torch.Tensor` or an empty list.
-                The state will be reset to this value when ``self.reset()`` is called.
+            default: Default value of the state; can either be a :class:`~torch.Tensor`, an empty list or an empty
+                :class:`~torchmetrics.utilities.data.CatBuffer`. The state will be reset to this value when
+                ``self.reset()`` is called.
             dist_reduce_fx (Optional): Function to reduce state across multiple processes in distributed mode.
                 If value is ``"sum"``, ``"mean"``, ``"cat"``, ``"min"`` or ``"max"`` we will use ``torch.sum``,
                 ``torch.mean``, ``torch.cat``, ``torch.min`` and ``torch.max``` respectively, each with argument
@@ -219,6 +328,18 @@ class Metric(Module, ABC):
                 a tensor. The user can also pass a custom function in this parameter.
             persistent (Optional): whether the state will be saved as part of the modules ``state_dict``.
                 Default is ``False``.
+            static_shape (Optional): whether the state is guaranteed to have the same shape on all processes at the
+                time of synchronization (for list states this refers to the concatenated state). If ``True``, the
+                barrier and exchange of shapes between processes is skipped when the state is gathered. Setting this
+                for states whose shape differ between processes leads to undefined behavior. Default is ``False``.
+
+        Note:
+            For states that are concatenated with ``dist_reduce_fx="cat"``, an empty
+            :class:`~torchmetrics.utilities.data.CatBuffer` can be used as ``default`` instead of an empty list. The
+            buffer supports ``append`` like a list, but copies the tensors into a single preallocated tensor that
+            grows by doubling its capacity. :func:`~torchmetrics.utilities.data.dim_zero_cat` returns a view of the
+            filled part of the buffer without concatenating. In the ``state_dict`` the state is saved as a list with a
+            single tensor, such that checkpoints are interchangeable with list states.
 
         Note:
             Setting ``dist_reduce_fx`` to None will return the metric state synchronized across different processes.
@@ -238,16 +359,28 @@ class Metric(Module, ABC):
             When passing a custom function to ``dist_reduce_fx``, expect the synchronized metric state to follow
             the format discussed in the above note.
 
+        Note:
+            Tensor states with ``dist_reduce_fx`` set to ``"sum"``, ``"mean"``, ``"min"`` or ``"max"`` are by default
+            synchronized with a single ``torch.distributed.all_reduce`` operation instead of first gathering the state
+            from all processes, such that no copy of the state is materialized per process. This only applies when no
+            custom ``dist_sync_fn`` is provided to the metric.
+
         Raises:
             ValueError:
-                If ``default`` is not a ``tensor`` or an ``empty list``.
+                If ``default`` is not a ``tensor``, an ``empty list`` or an empty ``CatBuffer``.
+            ValueError:
+                If ``default`` is a ``CatBuffer`` and ``dist_reduce_fx`` is not ``"cat"``.
             ValueError:
                 If ``dist_reduce_fx`` is not callable or one of ``"mean"``, ``"sum"``, ``"cat"``, ``"min"``,
                 ``"max"`` or ``None``.
 
         """
-        if not isinstance(default, (Tensor, list)) or (isinstance(default, list) and default):
-            raise ValueError("state variable must be a tensor or any empty list (where you can append tensors)")
+        if not isinstance(default, (Tensor, list, CatBuffer)) or (isinstance(default, (list, CatBuffer)) and default):
+            raise ValueError(
+                "state variable must be a tensor, any empty list or an empty `CatBuffer` (where you can append tensors)"
+            )
+        if isinstance(default, CatBuffer) and dist_reduce_fx not in ("cat", dim_zero_cat):
+            raise ValueError(f"`CatBuffer` states require `dist_reduce_fx='cat'` but got {dist_reduce_fx}")
 
         if dist_reduce_fx == "sum":
             dist_reduce_fx = dim_zero_sum
@@ -264,12 +397,16 @@ class Metric(Module, ABC):
 
         if isinstance(default, Tensor):
             default = default.contiguous()
+        elif isinstance(default, CatBuffer) and name not in self.__jit_ignored_attributes__:
+            # buffers are plain python objects, which cannot be represented in torchscript
+            self.__jit_ignored_attributes__ = [*self.__jit_ignored_attributes__, name]
 
         setattr(self, name, default)
 
         self._defaults[name] = deepcopy(default)
         self._persistent[name] = persistent
         self._reductions[name] = dist_reduce_fx
+        self._static_shapes[name] = static_shape
 
     @torch.jit.unused
     def forward(self, *args: Any, **kwargs: Any) -> Any:
@@ -412,6 +549,9 @@ class Metric(Module, ABC):
             elif reduce_fn == dim_zero_cat:
                 if isinstance(global_state, Tensor):
                     reduced = torch.cat([global_state, local_state])
+                elif isinstance(global_state, CatBuffer):
+                    global_state.extend(local_state)
+                    reduced = global_state
                 else:
                     reduced = global_state + local_state
             elif reduce_fn is None and isinstance(global_state, Tensor):
@@ -425,21 +565,88 @@ class Metric(Module, ABC):
             setattr(self, attr, reduced)
 
     def _sync_dist(self, dist_sync_fn: Callable = gather_all_tensors, process_group: Optional[Any] = None) -> None:
+        input_dict = self._get_sync_input()
+        group = process_group or self.process_group
+
+        # states with a sum, mean, max or min reduction can directly be reduced across processes instead of first being
+        # gathered, which is only possible when using the default sync function
+        reduce_ops = self._get_all_reduce_ops() if dist_sync_fn is gather_all_tensors else {}
+
+        if self.hierarchical_sync and dist_sync_fn is gather_all_tensors and group is None:
+            local_world_size = None if self.hierarchical_sync is True else self.hierarchical_sync
+            output_dict = {}
+            for attr, val in input_dict.items():
+                if attr in reduce_ops:
+                    output_dict[attr] = reduce_all_tensors_hierarchical(val, reduce_ops[attr], local_world_size)
+                else:
+                    output_dict[attr] = apply_to_collection(
+                        val, Tensor, gather_all_tensors_hierarchical, local_world_size=local_world_size
+                    )
+        elif self.coalesce_sync and dist_sync_fn is gather_all_tensors:
+            output_dict = _coalesced_sync_states(
+                [input_dict], [reduce_ops], group=group, static_shape=self._has_static_shapes(input_dict, reduce_ops)
+            )[0]
+        else:
+            output_dict = {}
+            for attr, val in input_dict.items():
+                if attr in reduce_ops:
+                    output_dict[attr] = reduce_all_tensors(val, reduce_ops[attr], group=group)
+                elif dist_sync_fn is gather_all_tensors and self._static_shapes.get(attr, False):
+                    output_dict[attr] = apply_to_collection(val, Tensor, dist_sync_fn, group=group, static_shape=True)
+                else:
+                    output_dict[attr] = apply_to_collection(val, Tensor, dist_sync_fn, group=group)
+
+        self._set_synced_states(output_dict, already_reduced=reduce_ops)
+
+    def _has_static_shapes(self, input_dict: Dict[str, Any], reduce_ops: Dict[str, str]) -> bool:
+        """Check if all states that will be gathered have been declared to have a static shape."""
+        return all(self._static_shapes.get(attr, False) for attr in input_dict if attr not in reduce_ops)
+
+    def _get_all_reduce_ops(self) -> Dict[str, str]:
+        """Get the tensor states that can be synced with an all-reduce instead of an all-gather and their reduction."""
+        reduce_ops = {}
+        for attr, reduction_fn in self._reductions.items():
+            state = getattr(self, attr)
+            if not isinstance(state, Tensor) or state.is_complex():
+                continue
+            if reduction_fn is dim_zero_sum:
+                reduce_ops[attr] = "sum"
+            # keep the gather path for non-floating point states to not change the behavior of ``torch.mean``
+            elif reduction_fn is dim_zero_mean and state.is_floating_point():
+                reduce_ops[attr] = "mean"
+            elif reduction_fn is dim_zero_max and state.dtype != torch.bool:
+                reduce_ops[attr] = "max"
+            elif reduction_fn is dim_zero_min and state.dtype != torch.bool:
+                reduce_ops[attr] = "min"
+        return reduce_ops
+
+    def _get_sync_input(self) -> Dict[str, Union[List[Tensor], Tensor]]:
+        """Collect the metric states that should be synchronized across processes."""
+        self._wait_for_cpu_offload()
         input_dict = {attr: getattr(self, attr) for attr in self._reductions}
 
         for attr, reduction_fn in self._reductions.items():
             # pre-concatenate metric states that are lists to reduce number of all_gather operations
             if reduction_fn == dim_zero_cat and isinstance(input_dict[attr], list) and len(input_dict[attr]) > 1:
                 input_dict[attr] = [dim_zero_cat(input_dict[attr])]
+            # buffers are already contiguous and are synced as a single tensor
+            elif isinstance(input_dict[attr], CatBuffer):
+                input_dict[attr] = [input_dict[attr].data] if input_dict[attr] else []
+        return input_dict
 
-        output_dict = apply_to_collection(
-            input_dict,
-            Tensor,
-            dist_sync_fn,
-            group=process_group or self.process_group,
-        )
+    def _set_synced_states(self, output_dict: Dict[str, Any], already_reduced: Collection[str] = ()) -> None:
+        """Reduce the gathered metric states and set them as the current states of the metric.
+
+        Args:
+            output_dict: the synced metric states
+            already_reduced: names of the states that have already been reduced across processes
 
+        """
         for attr, reduction_fn in self._reductions.items():
+            if attr in already_reduced:
+                setattr(self, attr, output_dict[attr])
+                continue
+
             # pre-processing ops (stack or flatten for inputs)
 
             if isinstance(output_dict[attr], list) and len(output_dict[attr]) == 0:
@@ -459,6 +666,11 @@ class Metric(Module, ABC):
     def _wrap_update(self, update: Callable) -> Callable:
         @functools.wraps(update)
         def wrapped_func(*args: Any, **kwargs: Any) -> None:
+            if self._sync_handle is not None:
+                raise TorchMetricsUserError(
+                    "The Metric has been asynchronously synchronized and cannot be updated."
+                    " HINT: Call ``compute`` or ``unsync`` first."
+                )
             self._computed = None
             self._update_count += 1
             with torch.set_grad_enabled(self._enable_grad):
@@ -481,11 +693,51 @@ class Metric(Module, ABC):
         return wrapped_func
 
     def _move_list_states_to_cpu(self) -> None:
-        """Move list states to cpu to save GPU memory."""
+        """Move list states to cpu to save GPU memory.
+
+        Only elements that are not already on cpu are moved. With ``compute_on_cpu="async"`` elements on a CUDA device
+        are copied into pinned host memory on a side stream without blocking the host, see
+        :meth:`_wait_for_cpu_offload`.
+
+        """
         for key in self._defaults:
             current_val = getattr(self, key)
             if isinstance(current_val, Sequence):
-                setattr(self, key, [cur_v.to("cpu") for cur_v in current_val])
+                setattr(self, key, [self._offload_to_cpu(cur_v) for cur_v in current_val])
+            elif isinstance(current_val, CatBuffer) and current_val and current_val.data.device.type != "cpu":
+                # the buffer is moved once, afterwards new elements are copied directly into the cpu storage
+                setattr(self, key, current_val.apply(lambda t: t.to("cpu")))
+        if self._offload_stream is not None and self._offload_event is None:
+            # one event for all copies issued by this update, which is what ``_wait_for_cpu_offload`` waits on
+            self._offload_event = torch.cuda.Event()
+            self._offload_event.record(self._offload_stream)
+
+    def _offload_to_cpu(self, tensor: Tensor) -> Tensor:
+        """Copy a single list state element to cpu, asynchronously into pinned memory if requested."""
+        if tensor.device.type == "cpu":
+            return tensor
+        if self.compute_on_cpu != "async" or tensor.device.type != "cuda":
+            return tensor.to("cpu")
+
+        if self._offload_stream is None or self._offload_stream.device != tensor.device:
+            self._wait_for_cpu_offload()
+            self._offload_stream = torch.cuda.Stream(device=tensor.device)
+        # the copy should only start after the kernels producing the tensor on the current stream have finished
+        self._offload_stream.wait_stream(torch.cuda.current_stream(tensor.device))
+        # a new event is recorded after the copies, the old one is superseded since the stream executes in order
+        self._offload_event = None
+        with torch.cuda.stream(self._offload_stream):
+            host_tensor = torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=True)
+            host_tensor.copy_(tensor, non_blocking=True)
+        # prevent the caching allocator from reusing the device memory before the copy has finished
+        tensor.record_stream(self._offload_stream)
+        return host_tensor
+
+    def _wait_for_cpu_offload(self) -> None:
+        """Block until all pending non-blocking copies of list states to cpu have finished."""
+        if self._offload_event is not None:
+            self._offload_event.synchronize()
+            self._offload_event = None
 
     def sync(
         self,
@@ -531,6 +783,73 @@ class Metric(Module, ABC):
         self._sync_dist(dist_sync_fn, process_group=process_group)
         self._is_synced = True
 
+    def sync_async(
+        self,
+        dist_sync_fn: Optional[Callable] = None,
+        process_group: Optional[Any] = None,
+        should_sync: bool = True,
+        distributed_available: Optional[Callable] = None,
+    ) -> MetricSyncHandle:
+        """Start synchronizing the metric states across processes without blocking.
+
+        All states are synchronized with coalesced, asynchronous collective operations (see the ``coalesce_sync``
+        argument), such that the synchronization can be overlapped with other work e.g. checkpointing or loading data
+        for the next epoch. The synchronized states are set on the metric when either :meth:`MetricSyncHandle.wait` or
+        ``compute`` is called. ``compute`` uses the synchronized states without syncing again and afterwards restores
+        the local states, such that accumulation can continue. The metric cannot be updated in between calling
+        ``sync_async`` and ``compute`` (or ``unsync``).
+
+        If a custom ``dist_sync_fn`` or ``hierarchical_sync`` is used, the synchronization cannot be done asynchronously
+        and is instead done when the returned handle is waited on.
+
+        Args:
+            dist_sync_fn: Function to be used to perform states synchronization
+            process_group:
+                Specify the process group on which synchronization is called.
+                default: `None` (which selects the entire world)
+            should_sync: Whether to apply to state synchronization. This will have an impact
+                only when running in a distributed setting.
+            distributed_available: Function to determine if we are running inside a distributed setting
+
+        Returns:
+            A handle to the pending synchronization
+
+        Raises:
+            TorchMetricsUserError:
+                If the metric is already synced or has a pending synchronization.
+
+        Example:
+            >>> from torchmetrics.aggregation import SumMetric
+            >>> metric = SumMetric()
+            >>> metric.update(1.0)
+            >>> handle = metric.sync_async()  # no-op when not running distributed
+            >>> metric.compute()
+            tensor(1.)
+
+        """
+        if (self._is_synced or self._sync_handle is not None) and should_sync:
+            raise TorchMetricsUserError("The Metric has already been synced.")
+
+        if distributed_available is None and self.distributed_available_fn is not None:
+            distributed_available = self.distributed_available_fn
+
+        is_distributed = distributed_available() if callable(distributed_available) else None
+
+        if not should_sync or not is_distributed:
+            return MetricSyncHandle([], lambda: None)
+
+        dist_sync_fn = dist_sync_fn or self.dist_sync_fn
+        if (dist_sync_fn is not None and dist_sync_fn is not gather_all_tensors) or self.hierarchical_sync:
+            # custom and hierarchical syncs are not asynchronous, so the sync is deferred until it is waited on
+            def finalize() -> None:
+                self.sync(dist_sync_fn=dist_sync_fn, process_group=process_group)
+
+            self._computed = None
+            self._sync_handle = MetricSyncHandle([], finalize)
+            return self._sync_handle
+
+        return _sync_metrics_async([self], group=process_group or self.process_group)
+
     def unsync(self, should_unsync: bool = True) -> None:
         """Unsync function for manually controlling when metrics states should be reverted back to their local states.
 
@@ -552,6 +871,7 @@ class Metric(Module, ABC):
             setattr(self, attr, val)
         self._is_synced = False
         self._cache = None
+        self._sync_handle = None
 
     @contextmanager
     def sync_context(
@@ -601,16 +921,38 @@ class Metric(Module, ABC):
                     UserWarning,
                 )
 
+            # pending copies of the states to cpu need to finish before the states can be used
+            self._wait_for_cpu_offload()
+
+            # wait for an asynchronous synchronization, after which the states are already synced
+            synced_async = self._sync_handle is not None
+            if self._sync_handle is not None:
+                self._sync_handle.wait()
+                self._sync_handle = None
+
             # return cached value
             if self._computed is not None:
                 return self._computed
 
+            if (
+                self.compute_on_rank is not None
+                and self.dist_sync_fn is None
+                and self._to_sync
+                and not synced_async
+                and self.distributed_available_fn()
+            ):
+                value = self._compute_on_rank(compute, *args, **kwargs)
+                # without broadcasting only one process has the value, so caching would make the processes diverge
+                if self.compute_with_cache and self.broadcast_compute_result:
+                    self._computed = value
+                return value
+
             # compute relies on the sync context manager to gather the states across processes and apply reduction
             # if synchronization happened, the current rank accumulated states will be restored to keep
             # accumulation going if ``should_unsync=True``,
             with self.sync_context(
                 dist_sync_fn=self.dist_sync_fn,
-                should_sync=self._to_sync,
+                should_sync=self._to_sync and not synced_async,
                 should_unsync=self._should_unsync,
             ):
                 value = _squeeze_if_scalar(compute(*args, **kwargs))
@@ -622,6 +964,41 @@ class Metric(Module, ABC):
 
         return wrapped_func
 
+    def _compute_on_rank(self, compute: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Gather the states onto ``compute_on_rank`` only, compute the value there and optionally broadcast it."""
+        dst = self.compute_on_rank
+        is_dst = torch.distributed.get_rank() == dst
+        input_dict = self._get_sync_input()
+        reduce_ops = self._get_all_reduce_ops()
+
+        output_dict = {}
+        for attr, val in input_dict.items():
+            if attr in reduce_ops:
+                output_dict[attr] = reduce_tensors_to_rank(val, reduce_ops[attr], dst=dst, group=self.process_group)
+            else:
+                output_dict[attr] = apply_to_collection(
+                    val,
+                    Tensor,
+                    gather_tensors_to_rank,
+                    dst=dst,
+                    group=self.process_group,
+                    static_shape=self._static_shapes.get(attr, False),
+                )
+
+        value = None
+        if is_dst:
+            self._cache = {attr: getattr(self, attr) for attr in self._defaults}
+            self._set_synced_states(output_dict, already_reduced=reduce_ops)
+            self._is_synced = True
+            value = _squeeze_if_scalar(compute(*args, **kwargs))
+            self.unsync(should_unsync=self._should_unsync)
+
+        if self.broadcast_compute_result:
+            obj = [value]
+            torch.distributed.broadcast_object_list(obj, src=dst, group=self.process_group)
+            value = obj[0]
+        return value
+
     @abstractmethod
     def update(self, *_: Any, **__: Any) -> None:
         """Override this method to update the state variables of your metric class."""
@@ -672,6 +1049,11 @@ class Metric(Module, ABC):
 
     def reset(self) -> None:
         """Reset metric state variables to their default value."""
+        self._wait_for_cpu_offload()
+        if self._sync_handle is not None:
+            # make sure that no collective operation is left pending, before discarding the synced states
+            self._sync_handle.wait()
+            self._sync_handle = None
         self._update_count = 0
         self._forward_cache = None
         self._computed = None
@@ -680,6 +1062,8 @@ class Metric(Module, ABC):
             current_val = getattr(self, attr)
             if isinstance(default, Tensor):
                 setattr(self, attr, default.detach().clone().to(current_val.device))
+            elif isinstance(default, CatBuffer):
+                setattr(self, attr, CatBuffer(default.capacity))
             else:
                 setattr(self, attr, [])
 
@@ -697,8 +1081,13 @@ class Metric(Module, ABC):
         Used for loading and saving a metric.
 
         """
+        self._wait_for_cpu_offload()
         # ignore update and compute functions for pickling
-        return {k: v for k, v in self.__dict__.items() if k not in ["update", "compute", "_update_signature"]}
+        return {
+            k: v
+            for k, v in self.__dict__.items()
+            if k not in ["update", "compute", "_update_signature", "_sync_handle", "_offload_stream", "_offload_event"]
+        }
 
     def __setstate__(self, state: Dict[str, Any]) -> None:
         """Set the state of the metric, based on a input state.
@@ -708,6 +1097,9 @@ class Metric(Module, ABC):
         """
         # manually restore update and compute functions for pickling
         self.__dict__.update(state)
+        self._sync_handle = None
+        self._offload_stream = None
+        self._offload_event = None
         self._update_signature = inspect.signature(self.update)
         self.update: Callable = self._wrap_update(self.update)  # type: ignore[method-assign]
         self.compute: Callable = self._wrap_compute(self.compute)  # type: ignore[method-assign]
@@ -791,6 +1183,7 @@ class Metric(Module, ABC):
                 by the metric class itself.
 
         """
+        self._wait_for_cpu_offload()
         this = super()._apply(fn)
         fs = str(fn)
         cond = any(f in fs for f in ["Module.type", "Module.half", "Module.float", "Module.double", "Module.bfloat16"])
@@ -810,6 +1203,8 @@ class Metric(Module, ABC):
             current_val = getattr(this, key)
             if isinstance(current_val, Tensor):
                 setattr(this, key, fn(current_val))
+            elif isinstance(current_val, CatBuffer):
+                setattr(this, key, current_val.apply(fn))
             elif isinstance(current_val, Sequence):
                 setattr(this, key, [fn(cur_v) for cur_v in current_val])
             else:
@@ -858,6 +1253,7 @@ class Metric(Module, ABC):
             keep_vars=keep_vars,
         )
         # Register metric states to be part of the state_dict
+        self._wait_for_cpu_offload()
         for key in self._defaults:
             if not self._persistent[key]:
                 continue
@@ -867,6 +1263,8 @@ class Metric(Module, ABC):
                     current_val = current_val.detach()
                 elif isinstance(current_val, list):
                     current_val = [cur_v.detach() if isinstance(cur_v, Tensor) else cur_v for cur_v in current_val]
+            if isinstance(current_val, CatBuffer):
+                current_val = [current_val.data.clone()] if current_val else []
             destination[prefix + key] = deepcopy(current_val)
         return destination
 
@@ -884,7 +1282,12 @@ class Metric(Module, ABC):
         for key in self._defaults:
             name = prefix + key
             if name in state_dict:
-                setattr(self, key, state_dict.pop(name))
+                value = state_dict.pop(name)
+                if isinstance(self._defaults[key], CatBuffer):
+                    buffer = CatBuffer(self._defaults[key].capacity)
+                    buffer.extend([value] if isinstance(value, Tensor) else value)
+                    value = buffer
+                setattr(self, key, value)
         super()._load_from_state_dict(
             state_dict, prefix, local_metadata, True, missing_keys, unexpected_keys, error_msgs
         )
@@ -910,6 +1313,58 @@ class Metric(Module, ABC):
             return kwargs
         return filtered_kwargs
 
+    def _compute_group_key(self) -> Optional[Hashable]:
+        """Get a key that is equal for metrics whose states are guaranteed to stay equal under the same updates.
+
+        The key consists of the ``update`` method of the class, the name, reduction, shape, dtype and device of each
+        state and the values of the attributes listed in ``_compute_group_attributes``. ``None`` is returned if the
+        metric does not declare these attributes, has no states or has already been updated.
+
+        """
+        if self._compute_group_attributes is None or not self._defaults or self._update_count > 0:
+            return None
+
+        states = []
+        for attr, reduction_fn in self._reductions.items():
+            state = getattr(self, attr)
+            if isinstance(state, Tensor):
+                states.append((attr, reduction_fn, tuple(state.shape), state.dtype, state.device))
+            else:
+                states.append((attr, reduction_fn, len(state)))
+
+        values = []
+        for attr in self._compute_group_attributes:
+            value = getattr(self, attr, None)
+            if isinstance(value, Tensor):
+                value = (tuple(value.shape), tuple(value.flatten().tolist()))
+            elif isinstance(value, list):
+                value = tuple(value)
+            values.append(value)
+
+        key = (type(self).update, tuple(states), tuple(values))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _statistic_key(self) -> Optional[Hashable]:
+        """Get a key identifying a sufficient statistic held by the states of the metric.
+
+        Other metrics returning the same key from ``_derived_statistic_key`` can derive their states from the states of
+        this metric, which allows ``MetricCollection`` to only update this metric. ``None`` if there is no such key.
+
+        """
+        return None
+
+    def _derived_statistic_key(self) -> Optional[Hashable]:
+        """Get the key of the sufficient statistic the states of the metric can be derived from (if any)."""
+        return None
+
+    def _derive_states(self, source: "Metric") -> None:
+        """Set the states of the metric from the states of a metric holding the sufficient statistic."""
+        raise NotImplementedError(f"Metric {self.__class__.__name__} cannot derive its states from another metric")
+
     def __hash__(self) -> int:
         """Return an unique hash of the metric.
 
@@ -1085,6 +1540,95 @@ def _neg(x: Tensor) -> Tensor:
     return -torch.abs(x)
 
 
+def _coalesced_sync_states(
+    input_dicts: Sequence[Dict[str, Union[List[Tensor], Tensor]]],
+    reduce_ops: Sequence[Dict[str, str]],
+    group: Optional[Any] = None,
+    static_shape: bool = False,
+) -> List[Dict[str, Any]]:
+    """Sync the states of one or more metrics with a single coalesced set of collective operations.
+
+    States listed in ``reduce_ops`` are reduced across processes with a coalesced all-reduce and are returned in their
+    final form. For all other states the output has the same structure as when applying ``gather_all_tensors`` to each
+    tensor in the state, meaning that tensor states are turned into a list over processes and list states into a list
+    of such lists. If ``static_shape`` is ``True`` all gathered states are assumed to have the same shape on all
+    processes.
+
+    """
+    works, finalize = _coalesced_sync_states_async(input_dicts, reduce_ops, group, static_shape)
+    for work in works:
+        work.wait()
+    return finalize()
+
+
+def _coalesced_sync_states_async(
+    input_dicts: Sequence[Dict[str, Union[List[Tensor], Tensor]]],
+    reduce_ops: Sequence[Dict[str, str]],
+    group: Optional[Any] = None,
+    static_shape: bool = False,
+) -> Tuple[List[Any], Callable[[], List[Dict[str, Any]]]]:
+    """Start the coalesced sync of the states of one or more metrics, without waiting for the result.
+
+    Returns the pending collective work handles and a function that returns the output of ``_coalesced_sync_states``
+    once all work handles have completed.
+
+    """
+    reduce_tensors: List[Tensor] = []
+    reduce_names: List[str] = []
+    gather_tensors: List[Tensor] = []
+    for input_dict, ops in zip(input_dicts, reduce_ops):
+        for attr, val in input_dict.items():
+            if attr in ops:
+                reduce_tensors.append(val)
+                reduce_names.append(ops[attr])
+            else:
+                gather_tensors.extend([val] if isinstance(val, Tensor) else val)
+
+    reduce_works, reduce_finalize = _reduce_all_tensors_coalesced_async(reduce_tensors, reduce_names, group=group)
+    gather_works, gather_finalize = _gather_all_tensors_coalesced_async(
+        gather_tensors, group=group, static_shape=static_shape
+    )
+
+    def finalize() -> List[Dict[str, Any]]:
+        reduced = iter(reduce_finalize())
+        gathered = iter(gather_finalize())
+        output_dicts = []
+        for input_dict, ops in zip(input_dicts, reduce_ops):
+            output_dict: Dict[str, Any] = {}
+            for attr, val in input_dict.items():
+                if attr in ops:
+                    output_dict[attr] = next(reduced)
+                else:
+                    output_dict[attr] = next(gathered) if isinstance(val, Tensor) else [next(gathered) for _ in val]
+            output_dicts.append(output_dict)
+        return output_dicts
+
+    return reduce_works + gather_works, finalize
+
+
+def _sync_metrics_async(metrics: Sequence[Metric], group: Optional[Any] = None) -> MetricSyncHandle:
+    """Start the asynchronous coalesced synchronization of the states of one or more metrics."""
+    input_dicts = [m._get_sync_input() for m in metrics]
+    reduce_ops = [m._get_all_reduce_ops() for m in metrics]
+    static_shape = all(m._has_static_shapes(i, r) for m, i, r in zip(metrics, input_dicts, reduce_ops))
+    for m in metrics:
+        # cache prior to syncing
+        m._cache = {attr: getattr(m, attr) for attr in m._defaults}
+        m._computed = None
+
+    works, finalize_states = _coalesced_sync_states_async(input_dicts, reduce_ops, group, static_shape)
+
+    def finalize() -> None:
+        for m, output_dict, ops in zip(metrics, finalize_states(), reduce_ops):
+            m._set_synced_states(output_dict, already_reduced=ops)
+            m._is_synced = True
+
+    handle = MetricSyncHandle(works, finalize)
+    for m in metrics:
+        m._sync_handle = handle
+    return handle
+
+
 class CompositionalMetric(Metric):
     """Composition of two metrics with a specific operator which will be executed upon metrics compute."""
 
@@ -18,7 +18,7 @@ from torch import Tensor
 from torchmetrics.functional.regression.spearman import _spearman_corrcoef_compute, _spearman_corrcoef_update
 from torchmetrics.metric import Metric
 from torchmetrics.utilities import rank_zero_warn
-from torchmetrics.utilities.data import dim_zero_cat
+from torchmetrics.utilities.data import CatBuffer, dim_zero_cat
 from torchmetrics.utilities.imports import _MATPLOTLIB_AVAILABLE
 from torchmetrics.utilities.plot import _AX_TYPE, _PLOT_OUT_TYPE
 
@@ -74,8 +74,8 @@ class SpearmanCorrCoef(Metric):
     plot_lower_bound: float = -1.0
     plot_upper_bound: float = 1.0
 
-    preds: List[Tensor]
-    target: List[Tensor]
+    preds: CatBuffer
+    target: CatBuffer
 
     def __init__(
         self,
@@ -91,8 +91,8 @@ class SpearmanCorrCoef(Metric):
             raise ValueError("Expected argument `num_outputs` to be an int larger than 0, but got {num_outputs}")
         self.num_outputs = num_outputs
 
-        self.add_state("preds", default=[], dist_reduce_fx="cat")
-        self.add_state("target", default=[], dist_reduce_fx="cat")
+        self.add_state("preds", default=CatBuffer(), dist_reduce_fx="cat")
+        self.add_state("target", default=CatBuffer(), dist_reduce_fx="cat")
 
     def update(self, preds: Tensor, target: Tensor) -> None:
         """Update state with predictions and targets."""
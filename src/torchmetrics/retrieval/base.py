@@ -20,7 +20,7 @@ from typing_extensions import Literal
 
 from torchmetrics import Metric
 from torchmetrics.utilities.checks import _check_retrieval_inputs
-from torchmetrics.utilities.data import _flexible_bincount, dim_zero_cat
+from torchmetrics.utilities.data import CatBuffer, _flexible_bincount, dim_zero_cat
 
 
 def _retrieval_aggregate(
@@ -97,9 +97,9 @@ class RetrievalMetric(Metric, ABC):
     higher_is_better: bool = True
     full_state_update: bool = False
 
-    indexes: List[Tensor]
-    preds: List[Tensor]
-    target: List[Tensor]
+    indexes: CatBuffer
+    preds: CatBuffer
+    target: CatBuffer
 
     def __init__(
         self,
@@ -127,9 +127,9 @@ class RetrievalMetric(Metric, ABC):
             )
         self.aggregation = aggregation
 
-        self.add_state("indexes", default=[], dist_reduce_fx=None)
-        self.add_state("preds", default=[], dist_reduce_fx=None)
-        self.add_state("target", default=[], dist_reduce_fx=None)
+        self.add_state("indexes", default=CatBuffer(), dist_reduce_fx="cat")
+        self.add_state("preds", default=CatBuffer(), dist_reduce_fx="cat")
+        self.add_state("target", default=CatBuffer(), dist_reduce_fx="cat")
 
     def update(self, preds: Tensor, target: Tensor, indexes: Tensor) -> None:
         """Check shape, check and convert dtypes, flatten and add to accumulators."""
@@ -145,7 +145,7 @@ class RetrievalMetric(Metric, ABC):
         self.target.append(target)
 
     def compute(self) -> Tensor:
-        """First concat state ``indexes``, ``preds`` and ``target`` since they were stored as lists.
+        """First concat state ``indexes``, ``preds`` and ``target``.
 
         After that, compute list of groups that will help in keeping together predictions about the same query. Finally,
         for each group compute the ``_metric`` if the number of positive targets is at least 1, otherwise behave as
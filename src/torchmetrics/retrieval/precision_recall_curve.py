@@ -21,7 +21,7 @@ from torchmetrics import Metric
 from torchmetrics.functional.retrieval.precision_recall_curve import retrieval_precision_recall_curve
 from torchmetrics.retrieval.base import _retrieval_aggregate
 from torchmetrics.utilities.checks import _check_retrieval_inputs
-from torchmetrics.utilities.data import _flexible_bincount, dim_zero_cat
+from torchmetrics.utilities.data import CatBuffer, _flexible_bincount, dim_zero_cat
 from torchmetrics.utilities.imports import _MATPLOTLIB_AVAILABLE
 from torchmetrics.utilities.plot import _AX_TYPE, _PLOT_OUT_TYPE, plot_curve
 
@@ -142,9 +142,9 @@ class RetrievalPrecisionRecallCurve(Metric):
     higher_is_better: bool = True
     full_state_update: bool = False
 
-    indexes: List[Tensor]
-    preds: List[Tensor]
-    target: List[Tensor]
+    indexes: CatBuffer
+    preds: CatBuffer
+    target: CatBuffer
 
     def __init__(
         self,
@@ -184,9 +184,9 @@ class RetrievalPrecisionRecallCurve(Metric):
             )
         self.aggregation = aggregation
 
-        self.add_state("indexes", default=[], dist_reduce_fx=None)
-        self.add_state("preds", default=[], dist_reduce_fx=None)
-        self.add_state("target", default=[], dist_reduce_fx=None)
+        self.add_state("indexes", default=CatBuffer(), dist_reduce_fx="cat")
+        self.add_state("preds", default=CatBuffer(), dist_reduce_fx="cat")
+        self.add_state("target", default=CatBuffer(), dist_reduce_fx="cat")
 
     def update(self, preds: Tensor, target: Tensor, indexes: Tensor) -> None:
         """Check shape, check and convert dtypes, flatten and add to accumulators."""
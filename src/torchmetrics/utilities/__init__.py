@@ -13,6 +13,7 @@
 # limitations under the License.
 from torchmetrics.utilities.checks import check_forward_full_state_property
 from torchmetrics.utilities.data import (
+    CatBuffer,
     dim_zero_cat,
     dim_zero_max,
     dim_zero_mean,
@@ -23,6 +24,7 @@ from torchmetrics.utilities.distributed import class_reduce, reduce
 from torchmetrics.utilities.prints import rank_zero_debug, rank_zero_info, rank_zero_warn
 
 __all__ = [
+    "CatBuffer",
     "check_forward_full_state_property",
     "class_reduce",
     "reduce",
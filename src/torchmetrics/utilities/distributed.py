@@ -11,11 +11,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Any, List, Optional
+import math
+import os
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import torch
 from torch import Tensor
-from torch.nn import functional as F  # noqa: N812
 from typing_extensions import Literal
 
 
@@ -88,13 +89,21 @@ def class_reduce(
     raise ValueError(f"Reduction parameter {class_reduction} unknown. Choose between one of these: {valid_reduction}")
 
 
+def _all_gather_into_tensor(output: Tensor, result: Tensor, group: Any, async_op: bool = False) -> Any:
+    """Gather ``result`` from all processes into the preallocated ``output`` tensor with leading process dimension."""
+    if hasattr(torch.distributed, "all_gather_into_tensor") and torch.distributed.get_backend(group) == "nccl":
+        return torch.distributed.all_gather_into_tensor(output, result, group=group, async_op=async_op)
+    # the rows of the preallocated output are contiguous views, so no additional memory is needed
+    return torch.distributed.all_gather(list(output.unbind(0)), result, group, async_op=async_op)
+
+
 def _simple_gather_all_tensors(result: Tensor, group: Any, world_size: int) -> List[Tensor]:
-    gathered_result = [torch.zeros_like(result) for _ in range(world_size)]
-    torch.distributed.all_gather(gathered_result, result, group)
-    return gathered_result
+    gathered_result = result.new_empty((world_size, *result.shape))
+    _all_gather_into_tensor(gathered_result, result, group)
+    return list(gathered_result.unbind(0))
 
 
-def gather_all_tensors(result: Tensor, group: Optional[Any] = None) -> List[Tensor]:
+def gather_all_tensors(result: Tensor, group: Optional[Any] = None, static_shape: bool = False) -> List[Tensor]:
     """Gather all tensors from several ddp processes onto a list that is broadcasted to all processes.
 
     Works on tensors that have the same number of dimensions, but where each dimension may differ. In this case
@@ -103,6 +112,8 @@ def gather_all_tensors(result: Tensor, group: Optional[Any] = None) -> List[Tens
     Args:
         result: the value to sync
         group: the process group to gather results from. Defaults to all processes (world)
+        static_shape: if it is guaranteed that the tensor has the same shape on all processes. In this case both the
+            barrier and the exchange of tensor shapes between processes are skipped, and the data is directly gathered.
 
     Return:
         list with size equal to the process group where element i corresponds to result tensor from process i
@@ -115,6 +126,9 @@ def gather_all_tensors(result: Tensor, group: Optional[Any] = None) -> List[Tens
     result = result.contiguous()
 
     world_size = torch.distributed.get_world_size(group)
+    if static_shape:
+        return _simple_gather_all_tensors(result, group, world_size)
+
     torch.distributed.barrier(group=group)
 
     # if the tensor is scalar, things are easy
@@ -123,8 +137,7 @@ def gather_all_tensors(result: Tensor, group: Optional[Any] = None) -> List[Tens
 
     # 1. Gather sizes of all tensors
     local_size = torch.tensor(result.shape, device=result.device)
-    local_sizes = [torch.zeros_like(local_size) for _ in range(world_size)]
-    torch.distributed.all_gather(local_sizes, local_size, group=group)
+    local_sizes = _simple_gather_all_tensors(local_size, group, world_size)
     max_size = torch.stack(local_sizes).max(dim=0).values
     all_sizes_equal = all(all(ls == max_size) for ls in local_sizes)
 
@@ -132,16 +145,447 @@ def gather_all_tensors(result: Tensor, group: Optional[Any] = None) -> List[Tens
     if all_sizes_equal:
         return _simple_gather_all_tensors(result, group, world_size)
 
-    # 3. If not, we need to pad each local tensor to maximum size, gather and then truncate
-    pad_dims = []
-    pad_by = (max_size - local_size).detach().cpu()
-    for val in reversed(pad_by):
-        pad_dims.append(0)
-        pad_dims.append(val.item())
-    result_padded = F.pad(result, pad_dims)
-    gathered_result = [torch.zeros_like(result_padded) for _ in range(world_size)]
-    torch.distributed.all_gather(gathered_result, result_padded, group)
-    for idx, item_size in enumerate(local_sizes):
-        slice_param = [slice(dim_size) for dim_size in item_size]
-        gathered_result[idx] = gathered_result[idx][slice_param]
-    return gathered_result
+    # 3. If not, we need to pad each local tensor to maximum size, gather into a single buffer and then truncate
+    max_size_list = max_size.tolist()
+    result_padded = result.new_zeros(max_size_list)
+    result_padded[tuple(slice(dim_size) for dim_size in result.shape)] = result
+    gathered_result = result.new_empty((world_size, *max_size_list))
+    _all_gather_into_tensor(gathered_result, result_padded, group)
+    return [
+        gathered_result[idx][tuple(slice(dim_size) for dim_size in item_size.tolist())]
+        for idx, item_size in enumerate(local_sizes)
+    ]
+
+
+def gather_all_tensors_coalesced(
+    tensors: Sequence[Tensor], group: Optional[Any] = None, static_shape: bool = False
+) -> List[List[Tensor]]:
+    """Gather a sequence of tensors from several ddp processes using as few collective operations as possible.
+
+    Instead of issuing a barrier, a shape exchange and a data exchange for every single tensor (as repeatedly calling
+    :func:`gather_all_tensors` would do), the shapes of all tensors are exchanged in a single operation and the data of
+    all tensors sharing the same dtype is flattened into one buffer that is gathered at once. The number of collective
+    operations is therefore ``1 + number_of_distinct_dtypes`` independent of the number of tensors.
+
+    Like :func:`gather_all_tensors` this works on tensors where each dimension may differ between processes, as long as
+    the number of dimensions of each tensor is the same on all processes.
+
+    Args:
+        tensors: the values to sync
+        group: the process group to gather results from. Defaults to all processes (world)
+        static_shape: if it is guaranteed that every tensor has the same shape on all processes, in which case the
+            exchange of shapes is skipped
+
+    Return:
+        list with the same length as ``tensors`` where element ``i`` is a list with size equal to the process group
+        where element ``j`` corresponds to tensor ``i`` from process ``j``
+
+    """
+    works, finalize = _gather_all_tensors_coalesced_async(tensors, group=group, static_shape=static_shape)
+    for work in works:
+        work.wait()
+    return finalize()
+
+
+def _gather_all_tensors_coalesced_async(
+    tensors: Sequence[Tensor], group: Optional[Any] = None, static_shape: bool = False
+) -> Tuple[List[Any], Callable[[], List[List[Tensor]]]]:
+    """Start the coalesced gathering of tensors without waiting for the data to arrive.
+
+    The (small) exchange of shapes is done synchronously, while the gathering of the data is issued asynchronously.
+
+    Return:
+        tuple with the list of pending collective work handles and a function that returns the gathered tensors (in
+        the format of :func:`gather_all_tensors_coalesced`) once all work handles have completed
+
+    """
+    if group is None:
+        group = torch.distributed.group.WORLD
+    if len(tensors) == 0:
+        return [], list
+
+    tensors = [t.contiguous() for t in tensors]
+    world_size = torch.distributed.get_world_size(group)
+
+    # 1. Gather the shapes of all tensors with a single collective
+    local_shapes = [s for t in tensors for s in t.shape]
+    if static_shape:
+        all_shapes = [local_shapes for _ in range(world_size)]
+    elif local_shapes:
+        local_shapes_tensor = torch.tensor(local_shapes, dtype=torch.long, device=tensors[0].device)
+        all_shapes = torch.stack(_simple_gather_all_tensors(local_shapes_tensor, group, world_size)).tolist()
+    else:
+        all_shapes = [[] for _ in range(world_size)]
+    shapes: List[List[Tuple[int, ...]]] = []
+    for rank_shapes in all_shapes:
+        offset, rank_tensor_shapes = 0, []
+        for t in tensors:
+            rank_tensor_shapes.append(tuple(rank_shapes[offset : offset + t.ndim]))
+            offset += t.ndim
+        shapes.append(rank_tensor_shapes)
+
+    # 2. Bucket tensors by dtype and gather each bucket as a single flat (padded) buffer
+    buckets: Dict[Tuple[torch.dtype, str], List[int]] = {}
+    for idx, t in enumerate(tensors):
+        buckets.setdefault((t.dtype, t.device.type), []).append(idx)
+
+    works = []
+    buffers = []
+    for indices in buckets.values():
+        numels = [[math.prod(shapes[rank][idx]) for idx in indices] for rank in range(world_size)]
+        max_numel = max(sum(rank_numels) for rank_numels in numels)
+
+        local = torch.cat([tensors[idx].reshape(-1) for idx in indices])
+        if local.numel() < max_numel:
+            local = torch.cat([local, local.new_zeros(max_numel - local.numel())])
+        buffer = local.new_empty(world_size, max_numel)
+        if max_numel > 0:
+            works.append(_all_gather_into_tensor(buffer, local, group, async_op=True))
+        buffers.append((indices, numels, buffer))
+
+    def finalize() -> List[List[Tensor]]:
+        gathered: List[List[Tensor]] = [[] for _ in tensors]
+        for indices, numels, buffer in buffers:
+            for rank in range(world_size):
+                offset = 0
+                for idx, numel in zip(indices, numels[rank]):
+                    gathered[idx].append(buffer[rank, offset : offset + numel].view(shapes[rank][idx]))
+                    offset += numel
+        return gathered
+
+    return works, finalize
+
+
+def _prepare_all_reduce_input(result: Tensor, reduce_op: str) -> Tensor:
+    """Copy the tensor into a contiguous buffer that can be reduced in-place, with the output dtype of the reduction."""
+    dtype = result.dtype
+    # follow the type promotion of ``torch.sum`` for integral and boolean tensors
+    if reduce_op == "sum" and not (result.is_floating_point() or result.is_complex()):
+        dtype = torch.int64
+    return result.to(dtype=dtype, memory_format=torch.contiguous_format, copy=True)
+
+
+def _get_all_reduce_op(reduce_op: str) -> Any:
+    if reduce_op in ("sum", "mean"):
+        return torch.distributed.ReduceOp.SUM
+    if reduce_op == "max":
+        return torch.distributed.ReduceOp.MAX
+    if reduce_op == "min":
+        return torch.distributed.ReduceOp.MIN
+    raise ValueError(f"Expected argument `reduce_op` to be one of 'sum', 'mean', 'max' or 'min', but got {reduce_op}")
+
+
+def reduce_all_tensors(
+    result: Tensor, reduce_op: Literal["sum", "mean", "max", "min"], group: Optional[Any] = None
+) -> Tensor:
+    """Reduce a tensor from several ddp processes with a single ``all_reduce`` operation.
+
+    The output is the same as first gathering the tensor from all processes with :func:`gather_all_tensors`, stacking
+    the result and then applying ``torch.sum``, ``torch.mean``, ``torch.max`` or ``torch.min`` along the process
+    dimension, but without materializing a copy of the tensor for each process. The tensor needs to have the same
+    shape on all processes.
+
+    Args:
+        result: the value to sync and reduce
+        reduce_op: the reduction to apply, one of ``"sum"``, ``"mean"``, ``"max"`` or ``"min"``
+        group: the process group to reduce results over. Defaults to all processes (world)
+
+    Return:
+        the reduced tensor, broadcasted to all processes
+
+    """
+    if group is None:
+        group = torch.distributed.group.WORLD
+
+    op = _get_all_reduce_op(reduce_op)
+    reduced = _prepare_all_reduce_input(result, reduce_op)
+    torch.distributed.all_reduce(reduced, op=op, group=group)
+    if reduce_op == "mean":
+        reduced = reduced / torch.distributed.get_world_size(group)
+    return reduced
+
+
+def reduce_all_tensors_coalesced(
+    tensors: Sequence[Tensor], reduce_ops: Sequence[Literal["sum", "mean", "max", "min"]], group: Optional[Any] = None
+) -> List[Tensor]:
+    """Reduce a sequence of tensors from several ddp processes using as few ``all_reduce`` operations as possible.
+
+    All tensors sharing the same reduction and dtype are flattened into a single buffer that is reduced at once, such
+    that the number of collective operations only depends on the number of distinct (reduction, dtype) pairs. See
+    :func:`reduce_all_tensors` for details on the reduction of each tensor.
+
+    Args:
+        tensors: the values to sync and reduce
+        reduce_ops: the reduction to apply to each tensor, each one of ``"sum"``, ``"mean"``, ``"max"`` or ``"min"``
+        group: the process group to reduce results over. Defaults to all processes (world)
+
+    Return:
+        list with the reduced tensors, in the same order as the input
+
+    """
+    works, finalize = _reduce_all_tensors_coalesced_async(tensors, reduce_ops, group=group)
+    for work in works:
+        work.wait()
+    return finalize()
+
+
+def _reduce_all_tensors_coalesced_async(
+    tensors: Sequence[Tensor], reduce_ops: Sequence[str], group: Optional[Any] = None
+) -> Tuple[List[Any], Callable[[], List[Tensor]]]:
+    """Start the coalesced reduction of tensors without waiting for the result.
+
+    Return:
+        tuple with the list of pending collective work handles and a function that returns the reduced tensors once all
+        work handles have completed
+
+    """
+    if group is None:
+        group = torch.distributed.group.WORLD
+    if len(tensors) != len(reduce_ops):
+        raise ValueError("Expected the same number of tensors and reductions")
+
+    prepared = [_prepare_all_reduce_input(t, op) for t, op in zip(tensors, reduce_ops)]
+    buckets: Dict[Tuple[str, torch.dtype, str], List[int]] = {}
+    for idx, (t, op) in enumerate(zip(prepared, reduce_ops)):
+        buckets.setdefault((op, t.dtype, t.device.type), []).append(idx)
+
+    works = []
+    buffers = []
+    for (reduce_op, _, _), indices in buckets.items():
+        buffer = torch.cat([prepared[idx].reshape(-1) for idx in indices])
+        works.append(torch.distributed.all_reduce(buffer, op=_get_all_reduce_op(reduce_op), group=group, async_op=True))
+        buffers.append((reduce_op, indices, buffer))
+
+    def finalize() -> List[Tensor]:
+        reduced: List[Tensor] = list(prepared)
+        for reduce_op, indices, buffer in buffers:
+            if reduce_op == "mean":
+                buffer = buffer / torch.distributed.get_world_size(group)
+            offset = 0
+            for idx in indices:
+                numel = prepared[idx].numel()
+                reduced[idx] = buffer[offset : offset + numel].view(prepared[idx].shape)
+                offset += numel
+        return reduced
+
+    return works, finalize
+
+
+# cache of the process groups used for hierarchical synchronization, keyed by the world group and local world size
+_HIERARCHICAL_GROUPS: Dict[Tuple[Any, int], Tuple[Any, Optional[Any]]] = {}
+
+
+def _get_local_world_size(local_world_size: Optional[int] = None) -> int:
+    """Get the number of processes per node, either as given or from the ``LOCAL_WORLD_SIZE`` environment variable."""
+    if local_world_size is None:
+        if "LOCAL_WORLD_SIZE" not in os.environ:
+            raise ValueError(
+                "Could not determine the number of processes per node for hierarchical synchronization. Either set the"
+                " `LOCAL_WORLD_SIZE` environment variable (done automatically by `torchrun`) or provide it explicitly."
+            )
+        local_world_size = int(os.environ["LOCAL_WORLD_SIZE"])
+    world_size = torch.distributed.get_world_size()
+    if local_world_size < 1 or world_size % local_world_size != 0:
+        raise ValueError(
+            f"Expected the world size ({world_size}) to be divisible by the local world size but got {local_world_size}"
+        )
+    return local_world_size
+
+
+def _get_hierarchical_groups(local_world_size: int) -> Tuple[Any, Optional[Any]]:
+    """Get the process group of all processes on the same node and the process group of the node leaders.
+
+    Nodes are assumed to consist of consecutive ranks, such that rank ``r`` lives on node ``r // local_world_size`` and
+    the process with the lowest rank on each node is its leader. The groups are created once and then cached, which
+    requires all processes to call this function the first time.
+
+    Return:
+        tuple with the node-local process group and the process group of the node leaders, which is ``None`` on all
+        processes that are not the leader of their node
+
+    """
+    key = (torch.distributed.group.WORLD, local_world_size)
+    if key not in _HIERARCHICAL_GROUPS:
+        world_size = torch.distributed.get_world_size()
+        rank = torch.distributed.get_rank()
+        # every process has to take part in the creation of every group, also the ones it is not a member of
+        intra_group = None
+        for start in range(0, world_size, local_world_size):
+            group = torch.distributed.new_group(list(range(start, start + local_world_size)))
+            if start <= rank < start + local_world_size:
+                intra_group = group
+        inter_group = torch.distributed.new_group(list(range(0, world_size, local_world_size)))
+        _HIERARCHICAL_GROUPS[key] = (intra_group, inter_group if rank % local_world_size == 0 else None)
+    return _HIERARCHICAL_GROUPS[key]
+
+
+def reduce_all_tensors_hierarchical(
+    result: Tensor, reduce_op: Literal["sum", "mean", "max", "min"], local_world_size: Optional[int] = None
+) -> Tensor:
+    """Reduce a tensor over all processes by first reducing inside each node and then across nodes.
+
+    The tensor is first reduced onto the leader process of each node over the fast node-local interconnect, then only
+    the leaders reduce their (already aggregated) tensor across the network and finally the result is broadcasted back
+    to all processes of each node. Compared to :func:`reduce_all_tensors` over the whole world, the traffic across
+    nodes therefore only scales with the number of nodes instead of the number of processes. The result is the same.
+
+    Args:
+        result: the value to sync and reduce
+        reduce_op: the reduction to apply, one of ``"sum"``, ``"mean"``, ``"max"`` or ``"min"``
+        local_world_size: the number of processes per node. Nodes are assumed to consist of consecutive ranks.
+            Defaults to the ``LOCAL_WORLD_SIZE`` environment variable (set by ``torchrun``)
+
+    Return:
+        the reduced tensor, broadcasted to all processes
+
+    """
+    local_world_size = _get_local_world_size(local_world_size)
+    world_size = torch.distributed.get_world_size()
+    if local_world_size in (1, world_size):
+        return reduce_all_tensors(result, reduce_op)
+
+    intra_group, inter_group = _get_hierarchical_groups(local_world_size)
+    leader = torch.distributed.get_rank() // local_world_size * local_world_size
+
+    op = _get_all_reduce_op(reduce_op)
+    reduced = _prepare_all_reduce_input(result, reduce_op)
+    torch.distributed.reduce(reduced, dst=leader, op=op, group=intra_group)
+    if inter_group is not None:
+        torch.distributed.all_reduce(reduced, op=op, group=inter_group)
+    torch.distributed.broadcast(reduced, src=leader, group=intra_group)
+    if reduce_op == "mean":
+        reduced = reduced / world_size
+    return reduced
+
+
+def gather_all_tensors_hierarchical(result: Tensor, local_world_size: Optional[int] = None) -> List[Tensor]:
+    """Gather a tensor from all processes by first gathering inside each node and then across nodes.
+
+    The tensors are first gathered inside each node, then only the leader process of each node exchanges the tensors of
+    its node across the network (with a single coalesced gather, see :func:`gather_all_tensors_coalesced`) and finally
+    the gathered tensors are broadcasted back to all processes of each node. The output is the same as the output of
+    :func:`gather_all_tensors` over the whole world, while only one process per node communicates across nodes.
+
+    Args:
+        result: the value to sync
+        local_world_size: the number of processes per node. Nodes are assumed to consist of consecutive ranks.
+            Defaults to the ``LOCAL_WORLD_SIZE`` environment variable (set by ``torchrun``)
+
+    Return:
+        list with size equal to the world size where element i corresponds to result tensor from process i
+
+    """
+    local_world_size = _get_local_world_size(local_world_size)
+    world_size = torch.distributed.get_world_size()
+    if local_world_size in (1, world_size):
+        return gather_all_tensors(result)
+
+    intra_group, inter_group = _get_hierarchical_groups(local_world_size)
+    leader = torch.distributed.get_rank() // local_world_size * local_world_size
+
+    node_result = gather_all_tensors(result, group=intra_group)
+    gathered: List[Tensor] = []
+    if inter_group is not None:
+        per_node = gather_all_tensors_coalesced(node_result, group=inter_group)
+        gathered = [
+            per_node[local_rank][node] for node in range(len(per_node[0])) for local_rank in range(len(per_node))
+        ]
+
+    # broadcast the shapes and the (flattened) data of the gathered tensors from the leader to the rest of the node
+    if result.ndim > 0:
+        if inter_group is not None:
+            shapes = torch.tensor([t.shape for t in gathered], dtype=torch.long, device=result.device)
+        else:
+            shapes = torch.empty(world_size, result.ndim, dtype=torch.long, device=result.device)
+        torch.distributed.broadcast(shapes, src=leader, group=intra_group)
+        shape_list = [tuple(s) for s in shapes.tolist()]
+    else:
+        shape_list = [() for _ in range(world_size)]
+
+    numels = [math.prod(shape) for shape in shape_list]
+    flat = torch.cat([t.reshape(-1) for t in gathered]) if inter_group is not None else result.new_empty(sum(numels))
+    if flat.numel() > 0:
+        torch.distributed.broadcast(flat, src=leader, group=intra_group)
+    return [chunk.view(shape) for chunk, shape in zip(flat.split(numels), shape_list)]
+
+
+def gather_tensors_to_rank(
+    result: Tensor, dst: int = 0, group: Optional[Any] = None, static_shape: bool = False
+) -> Optional[List[Tensor]]:
+    """Gather a tensor from several ddp processes onto a single destination process.
+
+    Works like :func:`gather_all_tensors`, including tensors where each dimension may differ between processes, but
+    the gathered tensors are only materialized on the destination process. Only the (small) shapes of the tensors are
+    exchanged between all processes.
+
+    Args:
+        result: the value to sync
+        dst: the global rank of the process to gather the tensors onto
+        group: the process group to gather results from. Defaults to all processes (world)
+        static_shape: if it is guaranteed that the tensor has the same shape on all processes. In this case the exchange
+            of tensor shapes between processes is skipped
+
+    Return:
+        on the destination process a list with size equal to the process group where element i corresponds to result
+        tensor from process i, ``None`` on all other processes
+
+    """
+    if group is None:
+        group = torch.distributed.group.WORLD
+
+    result = result.contiguous()
+    world_size = torch.distributed.get_world_size(group)
+    is_dst = torch.distributed.get_rank() == dst
+
+    if static_shape or result.ndim == 0:
+        local_sizes = [torch.tensor(result.shape, dtype=torch.long) for _ in range(world_size)]
+    else:
+        local_size = torch.tensor(result.shape, device=result.device)
+        local_sizes = _simple_gather_all_tensors(local_size, group, world_size)
+    max_size = torch.stack(local_sizes).max(dim=0).values.tolist() if result.ndim > 0 else []
+
+    if list(result.shape) != max_size:
+        result_padded = result.new_zeros(max_size)
+        result_padded[tuple(slice(dim_size) for dim_size in result.shape)] = result
+        result = result_padded
+
+    gathered_result = result.new_empty((world_size, *max_size)) if is_dst else None
+    torch.distributed.gather(
+        result, list(gathered_result.unbind(0)) if gathered_result is not None else None, dst=dst, group=group
+    )
+    if gathered_result is None:
+        return None
+    return [
+        gathered_result[idx][tuple(slice(dim_size) for dim_size in item_size.tolist())]
+        for idx, item_size in enumerate(local_sizes)
+    ]
+
+
+def reduce_tensors_to_rank(
+    result: Tensor, reduce_op: Literal["sum", "mean", "max", "min"], dst: int = 0, group: Optional[Any] = None
+) -> Optional[Tensor]:
+    """Reduce a tensor from several ddp processes onto a single destination process.
+
+    Works like :func:`reduce_all_tensors`, but the result is only available on the destination process.
+
+    Args:
+        result: the value to sync and reduce
+        reduce_op: the reduction to apply, one of ``"sum"``, ``"mean"``, ``"max"`` or ``"min"``
+        dst: the global rank of the process to reduce the tensor onto
+        group: the process group to reduce results over. Defaults to all processes (world)
+
+    Return:
+        the reduced tensor on the destination process, ``None`` on all other processes
+
+    """
+    if group is None:
+        group = torch.distributed.group.WORLD
+
+    op = _get_all_reduce_op(reduce_op)
+    reduced = _prepare_all_reduce_input(result, reduce_op)
+    torch.distributed.reduce(reduced, dst=dst, op=op, group=group)
+    if torch.distributed.get_rank() != dst:
+        return None
+    if reduce_op == "mean":
+        reduced = reduced / torch.distributed.get_world_size(group)
+    return reduced
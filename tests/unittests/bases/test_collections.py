@@ -29,6 +29,7 @@ from torchmetrics.classification import (
     MulticlassMatthewsCorrCoef,
     MulticlassPrecision,
     MulticlassRecall,
+    MulticlassSpecificity,
     MultilabelAUROC,
     MultilabelAveragePrecision,
 )
@@ -420,7 +421,9 @@ class TestComputeGroups:
         # Construct without for comparison
         m2 = MetricCollection(deepcopy(metrics), prefix=prefix, postfix=postfix, compute_groups=False)
 
-        assert len(m.compute_groups) == len(m)
+        # compute groups are determined at initialization, without any state comparisons
+        assert m._groups_checked
+        assert m.compute_groups == expected
         assert m2.compute_groups == {}
 
         for _ in range(2):  # repeat to emulate effect of multiple epochs
@@ -546,8 +549,8 @@ def test_compute_on_different_dtype():
         MulticlassConfusionMatrix(num_classes=3),
         MulticlassMatthewsCorrCoef(num_classes=3),
     ])
-    assert not m._groups_checked
-    assert m.compute_groups == {0: ["MulticlassConfusionMatrix"], 1: ["MulticlassMatthewsCorrCoef"]}
+    assert m._groups_checked
+    assert m.compute_groups == {0: ["MulticlassConfusionMatrix", "MulticlassMatthewsCorrCoef"]}
     preds = torch.randn(10, 3).softmax(dim=-1)
     target = torch.randint(3, (10,))
     for _ in range(2):
@@ -556,6 +559,79 @@ def test_compute_on_different_dtype():
     assert m.compute()
 
 
+def test_static_compute_groups():
+    """Check that compute groups are formed from static keys and only metrics without a key are compared."""
+    m = MetricCollection({
+        "acc": MulticlassAccuracy(num_classes=3),
+        "acc_ignore": MulticlassAccuracy(num_classes=3, ignore_index=0),
+        "recall_ignore": MulticlassRecall(num_classes=3, ignore_index=0),
+        "sum1": DummyMetricSum(),
+        "sum2": DummyMetricSum(),
+    })
+    # metrics with the same state but different arguments affecting ``update`` are not grouped
+    assert m.compute_groups == {0: ["acc"], 1: ["acc_ignore", "recall_ignore"], 2: ["sum1"], 3: ["sum2"]}
+    assert not m._groups_checked
+
+    m.update(preds=torch.tensor([0, 1, 2, 2]), target=torch.tensor([0, 1, 1, 2]), x=torch.tensor(1.0))
+    assert m.compute_groups == {0: ["acc"], 1: ["acc_ignore", "recall_ignore"], 2: ["sum1", "sum2"]}
+    assert m._groups_checked
+
+
+class _StaticKeyFullStateMetric(DummyMetricSum):
+    full_state_update = True
+    _compute_group_attributes = ()
+
+
+def test_static_compute_groups_forward():
+    """Check that forward of metrics sharing states in place does not accumulate a batch multiple times."""
+    m = MetricCollection({"a": _StaticKeyFullStateMetric(), "b": _StaticKeyFullStateMetric()})
+    assert m.compute_groups == {0: ["a", "b"]}
+    for x in range(1, 4):
+        out = m(torch.tensor(float(x)))
+        assert out == {"a": x, "b": x}
+    assert m["a"].x == 6
+    assert m.compute() == {"a": 6, "b": 6}
+
+
+@pytest.mark.parametrize("ignore_index", [None, 0, -1])
+def test_fused_compute_groups(ignore_index):
+    """Check that stat scores based metrics are derived from the confusion matrix instead of being updated."""
+    metrics = {
+        "acc": MulticlassAccuracy(num_classes=3, ignore_index=ignore_index),
+        "acc_micro": MulticlassAccuracy(num_classes=3, average="micro", ignore_index=ignore_index),
+        "precision": MulticlassPrecision(num_classes=3, average=None, ignore_index=ignore_index),
+        "specificity": MulticlassSpecificity(num_classes=3, ignore_index=ignore_index),
+        "confmat": MulticlassConfusionMatrix(num_classes=3, ignore_index=ignore_index),
+        "acc_samplewise": MulticlassAccuracy(num_classes=3, multidim_average="samplewise", ignore_index=ignore_index),
+    }
+    m = MetricCollection(deepcopy(metrics))
+    m2 = MetricCollection(deepcopy(metrics), compute_groups=False)
+    assert m.compute_groups == {
+        0: ["acc", "specificity"],
+        1: ["acc_micro"],
+        2: ["acc_samplewise"],
+        3: ["confmat"],
+        4: ["precision"],
+    }
+    # only the samplewise metric can not be derived from the confusion matrix
+    assert m._fused_groups == {0: 3, 1: 3, 4: 3}
+
+    for _ in range(2):
+        for _ in range(3):
+            m.update(_mc_preds, _mc_target)
+            m2.update(_mc_preds, _mc_target)
+        # the states of fused groups are only derived when they are needed
+        assert m._fused_states_outdated
+        assert m._modules["acc"].tp.sum() == 0
+
+        res, res2 = m.compute(), m2.compute()
+        for key in res:
+            assert torch.allclose(res[key], res2[key], equal_nan=True)
+        assert torch.equal(m["acc_micro"].tn, m2["acc_micro"].tn)
+        m.reset()
+        m2.reset()
+
+
 def test_error_on_wrong_specified_compute_groups():
     """Test that error is raised if user miss-specify the compute groups."""
     with pytest.raises(ValueError, match="Input MulticlassAccuracy in `compute_groups`.*"):
@@ -15,12 +15,21 @@ import os
 import sys
 from copy import deepcopy
 from functools import partial
+from typing import Any
 
 import pytest
 import torch
 from torch import tensor
-from torchmetrics import Metric
-from torchmetrics.utilities.distributed import gather_all_tensors
+from torchmetrics import Metric, MetricCollection
+from torchmetrics.utilities.data import CatBuffer, dim_zero_cat
+from torchmetrics.utilities.distributed import (
+    gather_all_tensors,
+    gather_all_tensors_coalesced,
+    gather_all_tensors_hierarchical,
+    gather_tensors_to_rank,
+    reduce_all_tensors_hierarchical,
+    reduce_tensors_to_rank,
+)
 from torchmetrics.utilities.exceptions import TorchMetricsUserError
 
 from unittests import NUM_PROCESSES
@@ -76,6 +85,15 @@ def _test_ddp_gather_uneven_tensors_multidim(rank: int, worldsize: int = NUM_PRO
         assert (val == torch.ones_like(val)).all()
 
 
+def _test_ddp_gather_static_shape(rank: int, worldsize: int = NUM_PROCESSES) -> None:
+    rank = torch.distributed.get_rank()  # the gathered tensors are ordered by global rank
+    tensor = torch.full((2, 3), rank)
+    result = gather_all_tensors(tensor, static_shape=True)
+    assert len(result) == worldsize
+    for idx in range(worldsize):
+        assert torch.equal(result[idx], torch.full((2, 3), idx))
+
+
 def _test_ddp_compositional_tensor(rank: int, worldsize: int = NUM_PROCESSES) -> None:
     dummy = DummyMetricSum()
     dummy._reductions = {"x": torch.sum}
@@ -95,6 +113,7 @@ def _test_ddp_compositional_tensor(rank: int, worldsize: int = NUM_PROCESSES) ->
         _test_ddp_sum_cat,
         _test_ddp_gather_uneven_tensors,
         _test_ddp_gather_uneven_tensors_multidim,
+        _test_ddp_gather_static_shape,
         _test_ddp_compositional_tensor,
     ],
 )
@@ -277,3 +296,367 @@ def _test_sync_with_empty_lists(rank):
 def test_sync_with_empty_lists():
     """Test that synchronization of states can be enabled and disabled for compute."""
     pytest.pool.map(_test_sync_with_empty_lists, range(NUM_PROCESSES))
+
+
+def _test_ddp_gather_all_tensors_coalesced(rank: int, worldsize: int = NUM_PROCESSES) -> None:
+    tensors = [
+        torch.ones(rank + 1, 2 - rank),
+        torch.full((3,), rank, dtype=torch.long),
+        tensor(float(rank)),
+        torch.arange(rank * 2, dtype=torch.long),
+    ]
+    result = gather_all_tensors_coalesced(tensors)
+    assert len(result) == len(tensors)
+    for res, t in zip(result, tensors):
+        expected = gather_all_tensors(t)
+        assert len(res) == worldsize
+        for r, e in zip(res, expected):
+            assert r.dtype == e.dtype
+            assert torch.equal(r, e)
+
+
+class _MultiStateMetric(Metric):
+    full_state_update = False
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.add_state("total", tensor(0.0), dist_reduce_fx="sum")
+        self.add_state("count", tensor(0), dist_reduce_fx="sum")
+        self.add_state("high", tensor(-1.0), dist_reduce_fx="max")
+        self.add_state("values", [], dist_reduce_fx="cat")
+        self.add_state("stacked", torch.zeros(3), dist_reduce_fx=None)
+
+    def update(self, x):
+        self.total += x.sum()
+        self.count += x.numel()
+        self.high = torch.max(self.high, x.max())
+        self.values.append(x)
+        self.stacked += x[:3]
+
+    def compute(self):
+        return self.total / self.count, self.high, dim_zero_cat(self.values), self.stacked
+
+
+def _test_ddp_coalesced_sync(rank: int, worldsize: int = NUM_PROCESSES) -> None:
+    metric = _MultiStateMetric()
+    coalesced_metric = _MultiStateMetric(coalesce_sync=True)
+    for i in range(rank + 2):  # uneven number of updates
+        x = torch.arange(3 + i, dtype=torch.float) + rank
+        metric.update(x)
+        coalesced_metric.update(x)
+
+    for res, coalesced_res in zip(metric.compute(), coalesced_metric.compute()):
+        assert torch.allclose(res, coalesced_res)
+
+    # local state is restored after sync
+    assert len(coalesced_metric.values) == rank + 2
+
+
+def _test_ddp_coalesced_sync_collection(rank: int, worldsize: int = NUM_PROCESSES) -> None:
+    collection = MetricCollection({"a": _MultiStateMetric(), "b": DummyMetricSum()})
+    coalesced_collection = MetricCollection(
+        {"a": _MultiStateMetric(coalesce_sync=True), "b": DummyMetricSum(coalesce_sync=True)}
+    )
+    for i in range(rank + 2):
+        x = torch.arange(3 + i, dtype=torch.float) + rank
+        collection["a"].update(x)
+        collection["b"].update(x.sum())
+        coalesced_collection["a"].update(x)
+        coalesced_collection["b"].update(x.sum())
+
+    res, coalesced_res = collection.compute(), coalesced_collection.compute()
+    for r, c in zip(res["a"], coalesced_res["a"]):
+        assert torch.allclose(r, c)
+    assert torch.allclose(res["b"], coalesced_res["b"])
+    for m in coalesced_collection.values(copy_state=False):
+        assert not m._is_synced
+
+
+@pytest.mark.DDP()
+@pytest.mark.skipif(sys.platform == "win32", reason="DDP not available on windows")
+@pytest.mark.parametrize(
+    "process",
+    [_test_ddp_gather_all_tensors_coalesced, _test_ddp_coalesced_sync, _test_ddp_coalesced_sync_collection],
+)
+def test_ddp_coalesced_sync(process):
+    """Test that coalesced synchronization of metric states gives the same result as the per state synchronization."""
+    pytest.pool.map(process, range(NUM_PROCESSES))
+
+
+class _CatBufferStateMetric(_MultiStateMetric):
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.add_state("values", CatBuffer(), dist_reduce_fx="cat")
+
+
+def _test_ddp_cat_buffer_state(rank: int, worldsize: int = NUM_PROCESSES, coalesce_sync: bool = False) -> None:
+    metric = _MultiStateMetric()
+    buffer_metric = _CatBufferStateMetric(coalesce_sync=coalesce_sync)
+    for i in range(rank + 2):  # uneven number of updates
+        x = torch.arange(3 + i, dtype=torch.float) + rank
+        metric.update(x)
+        buffer_metric.update(x)
+
+    for res, buffer_res in zip(metric.compute(), buffer_metric.compute()):
+        assert torch.allclose(res, buffer_res)
+
+    # local buffer is restored after sync
+    assert isinstance(buffer_metric.values, CatBuffer)
+    assert len(buffer_metric.values) == sum(3 + i for i in range(rank + 2))
+
+
+@pytest.mark.DDP()
+@pytest.mark.skipif(sys.platform == "win32", reason="DDP not available on windows")
+@pytest.mark.parametrize("coalesce_sync", [False, True])
+def test_ddp_cat_buffer_state(coalesce_sync):
+    """Test that buffer states are synchronized like list states."""
+    pytest.pool.map(partial(_test_ddp_cat_buffer_state, coalesce_sync=coalesce_sync), range(NUM_PROCESSES))
+
+
+class _ReduceStateMetric(Metric):
+    full_state_update = False
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.add_state("int_sum", torch.zeros(4, dtype=torch.int32), dist_reduce_fx="sum")
+        self.add_state("bool_sum", torch.zeros(4, dtype=torch.bool), dist_reduce_fx="sum")
+        self.add_state("mean", torch.zeros(2, 3), dist_reduce_fx="mean")
+        self.add_state("high", torch.full((2, 2), -1.0), dist_reduce_fx="max")
+        self.add_state("low", torch.zeros(3, dtype=torch.long), dist_reduce_fx="min")
+
+    def update(self, x):
+        self.int_sum += x.int()[:4]
+        self.bool_sum |= x[:4] > 2
+        self.mean += x[:6].reshape(2, 3)
+        self.high = torch.max(self.high, x[:4].reshape(2, 2))
+        self.low = torch.min(self.low, -x.long()[:3])
+
+    def compute(self):
+        return self.int_sum, self.bool_sum, self.mean, self.high, self.low
+
+
+def _test_ddp_all_reduce_states(rank: int, worldsize: int = NUM_PROCESSES, coalesce_sync: bool = False) -> None:
+    # a wrapped sync function forces the (reference) gather path
+    metric = _ReduceStateMetric(dist_sync_fn=lambda x, group: gather_all_tensors(x, group))
+    reduce_metric = _ReduceStateMetric(coalesce_sync=coalesce_sync)
+    assert set(reduce_metric._get_all_reduce_ops()) == {"int_sum", "bool_sum", "mean", "high", "low"}
+    assert reduce_metric._get_all_reduce_ops()["mean"] == "mean"
+
+    x = torch.arange(6, dtype=torch.float) * (rank + 1)
+    metric.update(x)
+    reduce_metric.update(x)
+    for res, reduce_res in zip(metric.compute(), reduce_metric.compute()):
+        assert res.dtype == reduce_res.dtype
+        assert res.shape == reduce_res.shape
+        assert torch.allclose(res, reduce_res)
+
+    # local state is untouched by the in-place reduction
+    assert torch.equal(reduce_metric.int_sum, x.int()[:4])
+
+
+@pytest.mark.DDP()
+@pytest.mark.skipif(sys.platform == "win32", reason="DDP not available on windows")
+@pytest.mark.parametrize("coalesce_sync", [False, True])
+def test_ddp_all_reduce_states(coalesce_sync):
+    """Test that states synced with all-reduce give the same result as states that are gathered and reduced."""
+    pytest.pool.map(partial(_test_ddp_all_reduce_states, coalesce_sync=coalesce_sync), range(NUM_PROCESSES))
+
+
+class _StaticShapeMetric(Metric):
+    full_state_update = False
+
+    def __init__(self, static_shape: bool = True, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.add_state("x", torch.zeros(3), dist_reduce_fx=None, static_shape=static_shape)
+        self.add_state("y", torch.zeros(2, dtype=torch.long), dist_reduce_fx=torch.sum, static_shape=static_shape)
+
+    def update(self, x):
+        self.x += x
+        self.y += x[:2].long()
+
+    def compute(self):
+        return self.x, self.y
+
+
+def _test_ddp_static_shape_states(rank: int, worldsize: int = NUM_PROCESSES, coalesce_sync: bool = False) -> None:
+    metric = _StaticShapeMetric(static_shape=False)
+    static_metric = _StaticShapeMetric(coalesce_sync=coalesce_sync)
+    x = torch.arange(3, dtype=torch.float) + rank
+    metric.update(x)
+    static_metric.update(x)
+    for res, static_res in zip(metric.compute(), static_metric.compute()):
+        assert torch.equal(res, static_res)
+
+
+@pytest.mark.DDP()
+@pytest.mark.skipif(sys.platform == "win32", reason="DDP not available on windows")
+@pytest.mark.parametrize("coalesce_sync", [False, True])
+def test_ddp_static_shape_states(coalesce_sync):
+    """Test that states declared with a static shape are synced correctly without the shape exchange."""
+    pytest.pool.map(partial(_test_ddp_static_shape_states, coalesce_sync=coalesce_sync), range(NUM_PROCESSES))
+
+
+def _test_ddp_sync_async(rank: int, worldsize: int = NUM_PROCESSES) -> None:
+    metric = _MultiStateMetric()
+    async_metric = _MultiStateMetric()
+    for i in range(rank + 2):
+        x = torch.arange(3 + i, dtype=torch.float) + rank
+        metric.update(x)
+        async_metric.update(x)
+
+    handle = async_metric.sync_async()
+    assert not async_metric._is_synced
+    with pytest.raises(TorchMetricsUserError, match="asynchronously synchronized"):
+        async_metric.update(x)
+    with pytest.raises(TorchMetricsUserError, match="The Metric has already been synced."):
+        async_metric.sync_async()
+
+    for res, async_res in zip(metric.compute(), async_metric.compute()):
+        assert torch.allclose(res, async_res)
+    assert handle.is_completed()
+    assert not async_metric._is_synced
+    assert len(async_metric.values) == rank + 2
+
+    # explicitly waiting on the handle sets the synced states
+    handle = async_metric.sync_async()
+    handle.wait()
+    assert async_metric._is_synced
+    assert isinstance(async_metric.values, torch.Tensor)
+    async_metric.unsync()
+
+    # custom sync functions are deferred until waited on
+    custom_metric = DummyMetricSum(dist_sync_fn=lambda x, group: gather_all_tensors(x, group))
+    custom_metric.update(tensor(rank + 1.0))
+    custom_metric.sync_async()
+    assert custom_metric.compute() == sum(range(1, worldsize + 1))
+
+
+def _test_ddp_sync_async_collection(rank: int, worldsize: int = NUM_PROCESSES) -> None:
+    collection = MetricCollection({"a": _MultiStateMetric(), "b": _StaticShapeMetric(), "c": _StaticShapeMetric()})
+    x = torch.arange(3, dtype=torch.float) + rank
+    collection.update(x=x)  # first update forms compute groups, b and c share state
+    collection.update(x=x)
+    assert collection.compute_groups == {0: ["a"], 1: ["b", "c"]}
+    expected = collection.compute()
+
+    collection.update(x=x)
+    handle = collection.sync_async()
+    assert collection["a"]._sync_handle is not None
+    handle.wait()
+    res = collection.compute()
+
+    assert torch.allclose(res["b"][0], 3 * expected["b"][0] / 2)
+    assert torch.equal(res["c"][1], res["b"][1])
+    assert torch.allclose(res["a"][0], expected["a"][0])
+    for m in collection.values(copy_state=False):
+        assert not m._is_synced
+        assert m._sync_handle is None
+
+
+@pytest.mark.DDP()
+@pytest.mark.skipif(sys.platform == "win32", reason="DDP not available on windows")
+@pytest.mark.parametrize("process", [_test_ddp_sync_async, _test_ddp_sync_async_collection])
+def test_ddp_sync_async(process):
+    """Test that asynchronous synchronization gives the same result as the blocking synchronization."""
+    pytest.pool.map(process, range(NUM_PROCESSES))
+
+
+def _test_ddp_gather_reduce_to_rank(rank: int, worldsize: int = NUM_PROCESSES) -> None:
+    rank = torch.distributed.get_rank()  # the destination is a global rank
+    tensor_ = torch.ones(rank + 1, 2) * rank
+    result = gather_tensors_to_rank(tensor_, dst=1)
+    if rank == 1:
+        assert len(result) == worldsize
+        for idx in range(worldsize):
+            assert torch.equal(result[idx], torch.ones(idx + 1, 2) * idx)
+    else:
+        assert result is None
+
+    result = reduce_tensors_to_rank(torch.arange(3) * (rank + 1), "sum", dst=1)
+    if rank == 1:
+        assert torch.equal(result, sum(torch.arange(3) * (r + 1) for r in range(worldsize)))
+    else:
+        assert result is None
+
+
+def _test_ddp_compute_on_rank(rank: int, worldsize: int = NUM_PROCESSES, broadcast_compute_result: bool = True) -> None:
+    rank = torch.distributed.get_rank()  # the destination is a global rank
+    metric = _MultiStateMetric()
+    rank_metric = _MultiStateMetric(compute_on_rank=1, broadcast_compute_result=broadcast_compute_result)
+    for i in range(rank + 2):
+        x = torch.arange(3 + i, dtype=torch.float) + rank
+        metric.update(x)
+        rank_metric.update(x)
+
+    expected = metric.compute()
+    for _ in range(2):  # caching must not make the processes diverge
+        res = rank_metric.compute()
+        if rank == 1 or broadcast_compute_result:
+            for r, e in zip(res, expected):
+                assert torch.allclose(r, e)
+        else:
+            assert res is None
+
+    # local states are restored to continue accumulation
+    assert not rank_metric._is_synced
+    assert len(rank_metric.values) == rank + 2
+    assert torch.equal(rank_metric.count, metric.count)
+
+
+@pytest.mark.DDP()
+@pytest.mark.skipif(sys.platform == "win32", reason="DDP not available on windows")
+@pytest.mark.parametrize(
+    "process",
+    [
+        _test_ddp_gather_reduce_to_rank,
+        partial(_test_ddp_compute_on_rank, broadcast_compute_result=True),
+        partial(_test_ddp_compute_on_rank, broadcast_compute_result=False),
+    ],
+)
+def test_ddp_compute_on_rank(process):
+    """Test that states can be synced onto a single process which alone computes the metric."""
+    pytest.pool.map(process, range(NUM_PROCESSES))
+
+
+def _test_ddp_hierarchical_sync(rank: int, worldsize: int, local_world_size: int) -> None:
+    os.environ["MASTER_ADDR"] = "localhost"
+    os.environ["MASTER_PORT"] = "12356"
+    torch.distributed.init_process_group("gloo", rank=rank, world_size=worldsize)
+
+    # uneven and scalar tensors are gathered in global rank order
+    tensor_ = torch.ones(rank + 1, 2) * rank
+    result = gather_all_tensors_hierarchical(tensor_, local_world_size=local_world_size)
+    assert len(result) == worldsize
+    for idx in range(worldsize):
+        assert torch.equal(result[idx], torch.ones(idx + 1, 2) * idx)
+    result = gather_all_tensors_hierarchical(tensor(rank), local_world_size=local_world_size)
+    assert torch.equal(torch.stack(result), torch.arange(worldsize))
+
+    for reduce_op, fn in [("sum", torch.sum), ("mean", torch.mean), ("max", torch.amax), ("min", torch.amin)]:
+        x = torch.arange(4, dtype=torch.float) * (rank + 1)
+        expected = fn(torch.stack([torch.arange(4, dtype=torch.float) * (r + 1) for r in range(worldsize)]), dim=0)
+        assert torch.allclose(
+            reduce_all_tensors_hierarchical(x, reduce_op, local_world_size=local_world_size), expected
+        )
+
+    # metrics give the same result as when synced over the flat world
+    for metric_class in (_MultiStateMetric, _ReduceStateMetric):
+        metric = metric_class()
+        hierarchical_metric = metric_class(hierarchical_sync=local_world_size)
+        for i in range(rank + 1):
+            x = torch.arange(6 + i, dtype=torch.float) + rank
+            metric.update(x)
+            hierarchical_metric.update(x)
+        for res, hierarchical_res in zip(metric.compute(), hierarchical_metric.compute()):
+            assert res.dtype == hierarchical_res.dtype
+            assert torch.allclose(res, hierarchical_res)
+
+    torch.distributed.destroy_process_group()
+
+
+@pytest.mark.DDP()
+@pytest.mark.skipif(sys.platform == "win32", reason="DDP not available on windows")
+def test_ddp_hierarchical_sync():
+    """Test hierarchical sync with a world of four processes split into two fake nodes."""
+    worldsize = 4
+    torch.multiprocessing.spawn(_test_ddp_hierarchical_sync, args=(worldsize, 2), nprocs=worldsize)
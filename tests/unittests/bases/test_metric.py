@@ -24,8 +24,10 @@ import pytest
 import torch
 from torch import Tensor, tensor
 from torch.nn import Module, Parameter
+from torchmetrics import Metric
 from torchmetrics.classification import BinaryAccuracy
 from torchmetrics.regression import PearsonCorrCoef
+from torchmetrics.utilities.data import CatBuffer, dim_zero_cat
 
 from unittests.helpers import seed_all
 from unittests.helpers.testers import DummyListMetric, DummyMetric, DummyMetricMultiOutput, DummyMetricSum
@@ -42,7 +44,7 @@ def test_error_on_wrong_input():
     with pytest.raises(ValueError, match="Expected keyword argument `dist_sync_fn` to be an callable function.*"):
         DummyMetric(dist_sync_fn=[2, 3])
 
-    with pytest.raises(ValueError, match="Expected keyword argument `compute_on_cpu` to be an `bool` but.*"):
+    with pytest.raises(ValueError, match="Expected keyword argument `compute_on_cpu` to be an `bool` or.*"):
         DummyMetric(compute_on_cpu=None)
 
     with pytest.raises(ValueError, match="Expected keyword argument `sync_on_compute` to be a `bool` but.*"):
@@ -51,6 +53,17 @@ def test_error_on_wrong_input():
     with pytest.raises(ValueError, match="Expected keyword argument `compute_with_cache` to be a `bool` but got.*"):
         DummyMetric(compute_with_cache=None)
 
+    with pytest.raises(
+        ValueError, match="Expected keyword argument `hierarchical_sync` to be a `bool` or a positive.*"
+    ):
+        DummyMetric(hierarchical_sync=-1)
+
+    with pytest.raises(ValueError, match="Expected keyword argument `compute_on_rank` to be a non-negative `int`.*"):
+        DummyMetric(compute_on_rank="0")
+
+    with pytest.raises(ValueError, match="Expected keyword argument `broadcast_compute_result` to be a `bool`.*"):
+        DummyMetric(broadcast_compute_result=None)
+
     with pytest.raises(ValueError, match="Unexpected keyword arguments: `foo`"):
         DummyMetric(foo=True)
 
@@ -539,9 +552,10 @@ def test_no_iteration_allowed():
 
 @pytest.mark.skipif(not torch.cuda.is_available(), reason="test requires cuda")
 @pytest.mark.parametrize("method", ["forward", "update"])
-def test_compute_on_cpu_arg_forward(method):
+@pytest.mark.parametrize("compute_on_cpu", [True, "async"])
+def test_compute_on_cpu_arg_forward(method, compute_on_cpu):
     """Test the `compute_on_cpu` argument works in combination with `forward` method."""
-    metric = DummyListMetric(compute_on_cpu=True)
+    metric = DummyListMetric(compute_on_cpu=compute_on_cpu)
     x = torch.randn(10).cuda()
     if method == "update":
         metric.update(x)
@@ -554,6 +568,34 @@ def test_compute_on_cpu_arg_forward(method):
     assert all(torch.allclose(v, x.cpu()) for v in val)
 
 
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="test requires cuda")
+def test_compute_on_cpu_async_pinned():
+    """Test that `compute_on_cpu="async"` copies into pinned memory and only waits when the states are needed."""
+    metric = DummyListMetric(compute_on_cpu="async")
+    xs = [torch.randn(1000, device="cuda") for _ in range(5)]
+    for x in xs:
+        metric.update(x)
+    assert metric._offload_event is not None
+    assert all(v.is_pinned() for v in metric.x)
+
+    state = metric.state_dict()
+    assert metric._offload_event is None
+    assert all(torch.allclose(v, x.cpu()) for v, x in zip(state["x"], xs))
+    assert all(torch.allclose(v, x.cpu()) for v, x in zip(metric.compute(), xs))
+
+
+@pytest.mark.parametrize("compute_on_cpu", [True, "async"])
+def test_compute_on_cpu_no_repeated_copy(compute_on_cpu):
+    """Test that list states already on cpu are not copied again after every update."""
+    metric = DummyListMetric(compute_on_cpu=compute_on_cpu)
+    metric.update(torch.randn(10))
+    first = metric.x[0]
+    metric.update(torch.randn(10))
+    assert metric.x[0] is first
+    assert len(metric.compute()) == 2
+    assert metric._offload_stream is None
+
+
 @pytest.mark.parametrize("method", ["forward", "update"])
 @pytest.mark.parametrize("metric", [DummyMetricSum, DummyListMetric])
 def test_update_properties(metric, method):
@@ -589,3 +631,62 @@ def test_dtype_property():
     assert metric.dtype == torch.float64  # should not change after initialization
     metric.set_dtype(torch.float32)
     assert metric.dtype == torch.float32
+
+
+class _CatBufferMetric(Metric):
+    """Metric storing its state in a growable buffer."""
+
+    full_state_update = False
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.add_state("x", CatBuffer(), dist_reduce_fx="cat", persistent=True)
+
+    def update(self, x):
+        self.x.append(x)
+
+    def compute(self):
+        return dim_zero_cat(self.x)
+
+
+@pytest.mark.parametrize("method", ["forward", "update"])
+def test_cat_buffer_state(method):
+    """Test that a buffer state gives the same results as a list state and survives reset, state dict and pickling."""
+    metric = _CatBufferMetric()
+    reference = DummyListMetric()
+    reference.persistent(True)
+    for _ in range(5):
+        x = torch.randn(4)
+        if method == "update":
+            metric.update(x)
+            reference.update(x)
+        else:
+            assert torch.equal(metric(x), x)
+            reference(x)
+    assert isinstance(metric.x, CatBuffer)
+    assert torch.equal(metric.compute(), dim_zero_cat(reference.x))
+
+    # state dict is interchangeable with list states
+    state_dict = metric.state_dict()
+    assert isinstance(state_dict["x"], list)
+    loaded = _CatBufferMetric()
+    loaded.load_state_dict(reference.state_dict())
+    assert isinstance(loaded.x, CatBuffer)
+    assert torch.equal(loaded.compute(), metric.compute())
+
+    restored = pickle.loads(pickle.dumps(metric))
+    assert torch.equal(restored.compute(), metric.compute())
+
+    metric.set_dtype(torch.float64)
+    assert metric.x.data.dtype == torch.float64
+
+    metric.reset()
+    assert isinstance(metric.x, CatBuffer)
+    assert len(metric.x) == 0
+
+
+def test_cat_buffer_state_wrong_reduction():
+    """Test that buffer states can only be used with the cat reduction."""
+    metric = DummyMetric()
+    with pytest.raises(ValueError, match="`CatBuffer` states require `dist_reduce_fx='cat'`.*"):
+        metric.add_state("buffer", CatBuffer(), dist_reduce_fx="sum")
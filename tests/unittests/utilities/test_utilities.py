@@ -21,10 +21,12 @@ from torchmetrics.regression import MeanSquaredError, PearsonCorrCoef
 from torchmetrics.utilities import check_forward_full_state_property, rank_zero_debug, rank_zero_info, rank_zero_warn
 from torchmetrics.utilities.checks import _allclose_recursive
 from torchmetrics.utilities.data import (
+    CatBuffer,
     _bincount,
     _cumsum,
     _flatten,
     _flatten_dict,
+    dim_zero_cat,
     select_topk,
     to_categorical,
     to_onehot,
@@ -122,6 +124,34 @@ def test_flatten_dict():
     assert out_dup is False
 
 
+def test_cat_buffer():
+    """Check that the growable buffer matches concatenation of a list of tensors."""
+    values = [torch.randn(n, 3) for n in [1, 5, 2, 10, 0, 7]]
+    buffer = CatBuffer()
+    for v in values:
+        buffer.append(v)
+    assert len(buffer) == 25
+    assert buffer._storage.shape[0] >= 25
+    assert torch.equal(dim_zero_cat(buffer), torch.cat(values))
+    assert dim_zero_cat(buffer).data_ptr() == buffer._storage.data_ptr()
+
+    other = CatBuffer(capacity=100)
+    other.extend(buffer)
+    other.append(torch.ones(1, 3))
+    assert other._storage.shape[0] == 100
+    assert torch.equal(dim_zero_cat(other)[:-1], dim_zero_cat(buffer))
+
+    clone = other.clone()
+    clone.append(torch.zeros(1, 3))
+    assert len(clone) == 27
+    assert len(other) == 26
+
+    with pytest.raises(ValueError, match="Expected tensors appended to the buffer to have shape.*"):
+        buffer.append(torch.randn(2, 4))
+    with pytest.raises(ValueError, match="No samples to concatenate"):
+        dim_zero_cat(CatBuffer())
+
+
 @pytest.mark.skipif(not torch.cuda.is_available(), reason="test requires gpu")
 def test_bincount(use_deterministic_algorithms):
     """Test that bincount works in deterministic setting on GPU."""